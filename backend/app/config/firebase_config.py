@@ -3,26 +3,49 @@ Firebase Configuration Module
 
 Initializes Firebase Admin SDK with credentials from environment variables.
 Provides access to Firebase Auth, Firestore, and Storage services.
+
+Firestore clients are created exactly once per process. Always obtain one via
+get_db() rather than calling firestore.client() directly, so every request
+reuses the same gRPC channel and connection pool. Setting FIRESTORE_POOL_SIZE
+above 1 creates a small pool of clients that get_db() hands out round-robin,
+which spreads load across channels on write-heavy workloads.
+
+get_async_db() returns a separate asyncio Firestore client for async handlers
+that want to await Firestore directly instead of tying up a worker thread.
 """
 
 import os
+import functools
+import itertools
+import logging
+import threading
 import firebase_admin
-from firebase_admin import credentials, auth, firestore, storage
+from firebase_admin import auth
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file (production containers set real env vars, so skip the file I/O)
+if os.getenv('ENVIRONMENT') != 'production':
+    load_dotenv()
+
+logger = logging.getLogger(__name__)
 
-# Global references for Firebase services
-firebase_auth = None
-firebase_db = None
-firebase_bucket = None
+# Round-robin iterator over the Firestore client pool (set by initialize_firebase)
+_db_cycle = None
 
+# Serializes the first initialization across threads
+_init_lock = threading.Lock()
 
+
+@functools.cache
 def initialize_firebase():
     """
     Initialize Firebase Admin SDK with credentials from environment variables.
     
+    The result is cached, so only the first successful call performs the
+    initialization; a failed attempt is not cached and will be retried.
+    Concurrent first calls are serialized by a lock, so the SDK is never
+    initialized twice.
+    
     Returns:
         tuple: (auth, db, bucket) - Firebase Auth, Firestore client, and Storage bucket
         
@@ -30,11 +53,22 @@ def initialize_firebase():
         ValueError: If required environment variables are missing
         Exception: If Firebase initialization fails
     """
-    global firebase_auth, firebase_db, firebase_bucket
+    with _init_lock:
+        # Threads that waited on the lock get the result cached by the first one
+        return _initialize_services()
+
+
+@functools.cache
+def _initialize_services():
+    """Create the Firebase app and service clients (called under _init_lock)."""
+    global _db_cycle
+    
+    # Imported lazily: these pull in gRPC, protobuf and the Cloud client libraries,
+    # which tooling that merely imports this module (e.g. pytest collection) doesn't need
+    from firebase_admin import credentials, firestore, storage
     
-    # Check if already initialized
-    if firebase_auth is not None:
-        return firebase_auth, firebase_db, firebase_bucket
+    # Apps created by this attempt, removed again if it fails part-way
+    created_apps = []
     
     try:
         # Retrieve required environment variables
@@ -49,8 +83,12 @@ def initialize_firebase():
             'FIREBASE_STORAGE_BUCKET'
         ]
         
+        # Read every required variable from the environment in a single pass
+        env = os.environ
+        vals = {var: env.get(var) for var in required_vars}
+        
         # Validate all required variables are present
-        missing_vars = [var for var in required_vars if not os.getenv(var)]
+        missing_vars = [var for var, value in vals.items() if not value]
         if missing_vars:
             raise ValueError(
                 f"Missing required environment variables: {', '.join(missing_vars)}\n"
@@ -60,56 +98,89 @@ def initialize_firebase():
         # Create credentials dictionary from environment variables
         cred_dict = {
             "type": "service_account",
-            "project_id": os.getenv('FIREBASE_PROJECT_ID'),
-            "private_key_id": os.getenv('FIREBASE_PRIVATE_KEY_ID'),
-            "private_key": os.getenv('FIREBASE_PRIVATE_KEY').replace('\\n', '\n'),  # Handle escaped newlines
-            "client_email": os.getenv('FIREBASE_CLIENT_EMAIL'),
-            "client_id": os.getenv('FIREBASE_CLIENT_ID'),
-            "auth_uri": os.getenv('FIREBASE_AUTH_URI'),
-            "token_uri": os.getenv('FIREBASE_TOKEN_URI'),
+            "project_id": vals['FIREBASE_PROJECT_ID'],
+            "private_key_id": vals['FIREBASE_PRIVATE_KEY_ID'],
+            "private_key": vals['FIREBASE_PRIVATE_KEY'].replace('\\n', '\n'),  # Handle escaped newlines
+            "client_email": vals['FIREBASE_CLIENT_EMAIL'],
+            "client_id": vals['FIREBASE_CLIENT_ID'],
+            "auth_uri": vals['FIREBASE_AUTH_URI'],
+            "token_uri": vals['FIREBASE_TOKEN_URI'],
             "auth_provider_x509_cert_url": "https://www.googleapis.com/oauth2/v1/certs",
-            "client_x509_cert_url": f"https://www.googleapis.com/robot/v1/metadata/x509/{os.getenv('FIREBASE_CLIENT_EMAIL')}"
+            "client_x509_cert_url": f"https://www.googleapis.com/robot/v1/metadata/x509/{vals['FIREBASE_CLIENT_EMAIL']}"
         }
         
+        # Guard against a second default app (and a second Firestore client)
+        if firebase_admin._DEFAULT_APP_NAME in firebase_admin._apps:
+            raise RuntimeError(
+                "Firebase Admin SDK is already initialized. "
+                "Use get_db() to access the shared Firestore client."
+            )
+        
         # Initialize Firebase Admin SDK
         cred = credentials.Certificate(cred_dict)
-        firebase_admin.initialize_app(cred, {
-            'storageBucket': os.getenv('FIREBASE_STORAGE_BUCKET')
-        })
+        options = {'storageBucket': vals['FIREBASE_STORAGE_BUCKET']}
+        created_apps.append(firebase_admin.initialize_app(cred, options))
         
         # Initialize service references
-        firebase_auth = auth
-        firebase_db = firestore.client()
-        firebase_bucket = storage.bucket()
+        services = (auth, firestore.client(), storage.bucket())
+        
+        # Optionally add extra Firestore clients, each on its own named app
+        pool_size = max(1, int(env.get('FIRESTORE_POOL_SIZE') or 1))
+        db_pool = [services[1]]
+        for i in range(1, pool_size):
+            pool_app = firebase_admin.initialize_app(cred, options, name=f"firestore-pool-{i}")
+            created_apps.append(pool_app)
+            db_pool.append(firestore.client(app=pool_app))
+        _db_cycle = itertools.cycle(db_pool)
         
-        print("✓ Firebase initialized successfully")
+        logger.info("✓ Firebase initialized successfully")
         
-        return firebase_auth, firebase_db, firebase_bucket
+        return services
         
     except ValueError as ve:
-        print(f"✗ Firebase initialization failed: {ve}")
+        logger.error("✗ Firebase initialization failed: %s", ve)
         raise
     except Exception as e:
-        print(f"✗ Firebase initialization failed: {str(e)}")
+        logger.error("✗ Firebase initialization failed: %s", e)
+        
+        # Undo a partial initialization (e.g. initialize_app succeeded but a
+        # service client failed) so the next call can retry from scratch
+        # instead of tripping the already-initialized guard
+        for app in created_apps:
+            try:
+                firebase_admin.delete_app(app)
+            except ValueError:
+                pass
+        
         raise Exception(f"Failed to initialize Firebase: {str(e)}")
 
 
+@functools.cache
 def get_auth():
     """Get Firebase Auth instance."""
-    if firebase_auth is None:
-        initialize_firebase()
-    return firebase_auth
+    return initialize_firebase()[0]
 
 
 def get_db():
-    """Get Firestore client instance."""
-    if firebase_db is None:
-        initialize_firebase()
-    return firebase_db
+    """Get Firestore client instance (round-robin across the pool, if enabled)."""
+    initialize_firebase()
+    return next(_db_cycle)
+
+
+@functools.cache
+def get_async_db():
+    """
+    Get asyncio Firestore client instance.
+    
+    Its gRPC channel is bound to the running event loop, so only call this
+    (and await its methods) from async code on the server's loop.
+    """
+    initialize_firebase()
+    from firebase_admin import firestore_async
+    return firestore_async.client()
 
 
+@functools.cache
 def get_bucket():
     """Get Firebase Storage bucket instance."""
-    if firebase_bucket is None:
-        initialize_firebase()
-    return firebase_bucket
+    return initialize_firebase()[2]
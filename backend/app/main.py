@@ -5,27 +5,55 @@ Entry point for the AI Story Generator backend API.
 """
 
 import os
+import time
+import queue
+import atexit
+import asyncio
+import logging
+import logging.handlers
+from datetime import datetime, timezone
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from app.config.firebase_config import initialize_firebase
+from fastapi.responses import ORJSONResponse
+from app.config.firebase_config import initialize_firebase, get_db
 from app.routes import auth, story, admin
 import firebase_admin.exceptions
 
+# Configure logging once for the whole application. Records are formatted by
+# the QueueHandler and handed to a listener thread that writes them to stderr,
+# so request handlers and generation tasks never block on the stream.
+_log_queue = queue.SimpleQueue()
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    format="%(asctime)s %(levelname)s %(name)s %(message)s",
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
+)
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+atexit.register(_log_listener.stop)
+logger = logging.getLogger(__name__)
+
+# Process start time, used to report uptime from the health check
+_PROCESS_START_TS = time.time()
+
 # Create FastAPI application
 app = FastAPI(
     title="AI Story Generator API",
     description="Generate AI stories with images, audio, and video",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Get allowed origins from environment variable
 allowed_origins_str = os.getenv("ALLOWED_ORIGINS", "http://localhost:3000")
-allowed_origins = [origin.strip() for origin in allowed_origins_str.split(",")]
+# Build once at import time as a tuple, skipping empty entries from stray commas
+allowed_origins = tuple(
+    origin for origin in (o.strip() for o in allowed_origins_str.split(",")) if origin
+)
 
-print(f"🔒 CORS Origins: {allowed_origins}")
+logger.info("🔒 CORS Origins: %s", allowed_origins)
 
 # Configure CORS middleware
 app.add_middleware(
@@ -39,6 +67,30 @@ app.add_middleware(
 )
 
 
+# Interval (seconds) for the optional Firestore keep-alive ping; 0 disables it
+FIRESTORE_KEEPALIVE_SECONDS = int(os.getenv("FIRESTORE_KEEPALIVE_SECONDS", "0"))
+
+
+def _warm_firestore() -> None:
+    """
+    Issue a cheap Firestore query so the gRPC channel, TLS handshake and
+    auth token exchange happen before the first real request.
+    """
+    get_db().collection('_warmup').limit(1).get()
+
+
+async def _firestore_keepalive(interval: int) -> None:
+    """
+    Periodically ping Firestore so the gRPC channel never goes idle.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(_warm_firestore)
+        except Exception as e:
+            logger.warning("⚠ Firestore keep-alive failed: %s", e)
+
+
 # Startup event - Initialize Firebase
 @app.on_event("startup")
 async def startup_event():
@@ -46,15 +98,50 @@ async def startup_event():
     Initialize Firebase services on application startup.
     """
     try:
-        print("🚀 Starting AI Story Generator API...")
+        logger.info("🚀 Starting AI Story Generator API...")
         initialize_firebase()
-        print("✓ Firebase initialized successfully")
-        print("📚 API Documentation: http://localhost:8000/docs")
+        
+        # Warm up the Firestore connection so the first request doesn't pay for it
+        try:
+            _warm_firestore()
+            logger.info("✓ Firestore connection warmed up")
+        except Exception as e:
+            logger.warning("⚠ Firestore warm-up failed: %s", e)
+        
+        # Fetch Firebase Auth signing keys so the first token check doesn't pay for it
+        await asyncio.to_thread(auth.warm_public_keys)
+        logger.info("✓ Firebase Auth public keys cached")
+        
+        if FIRESTORE_KEEPALIVE_SECONDS > 0:
+            app.state.firestore_keepalive = asyncio.create_task(
+                _firestore_keepalive(FIRESTORE_KEEPALIVE_SECONDS)
+            )
+        
+        # Admin audit logs are written off the request path in batches
+        app.state.admin_log_writer = asyncio.create_task(admin.run_admin_log_writer())
+        
+        logger.info("📚 API Documentation: http://localhost:8000/docs")
     except Exception as e:
-        print(f"✗ Startup failed: {str(e)}")
+        logger.error("✗ Startup failed: %s", e)
         raise
 
 
+# Shutdown event - Stop background tasks and flush pending admin logs
+@app.on_event("shutdown")
+async def shutdown_event():
+    """
+    Stop background tasks, flushing any queued admin logs.
+    """
+    for task_name in ("firestore_keepalive", "admin_log_writer"):
+        task = getattr(app.state, task_name, None)
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
 # Include routers (prefixes already defined in routers)
 app.include_router(auth.router, tags=["Authentication"])
 app.include_router(story.router, tags=["Stories"])
@@ -75,6 +162,25 @@ async def root():
     }
 
 
+# Skip the Firestore probe if it last succeeded less than this many seconds ago
+HEALTH_CHECK_TTL_SECONDS = 10
+_last_firestore_ok_ts = 0.0
+
+# (epoch seconds, ISO-8601 string) of the last formatted health-check timestamp
+_health_ts_cache = (0.0, "")
+
+
+def _health_timestamp(now: float) -> str:
+    """
+    Return the current UTC time as ISO-8601, reformatting at most once per second.
+    """
+    global _health_ts_cache
+    
+    if now - _health_ts_cache[0] >= 1.0:
+        _health_ts_cache = (now, datetime.fromtimestamp(now, tz=timezone.utc).isoformat())
+    return _health_ts_cache[1]
+
+
 @app.get("/health")
 async def health_check():
     """
@@ -83,13 +189,13 @@ async def health_check():
     Returns:
         dict: Health status with timestamp and service checks
     """
-    import time
-    from datetime import datetime
+    global _last_firestore_ok_ts
     
+    now = time.time()
     health_status = {
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "uptime": time.time(),
+        "timestamp": _health_timestamp(now),
+        "uptime": now - _PROCESS_START_TS,
         "version": "1.0.0",
         "services": {
             "api": "operational",
@@ -97,16 +203,13 @@ async def health_check():
         }
     }
     
-    # Check Firebase connection
+    # Check Firebase connection (only if the last successful check has expired)
     try:
-        from app.config.firebase_config import firebase_db
-        if firebase_db:
+        if now - _last_firestore_ok_ts >= HEALTH_CHECK_TTL_SECONDS:
             # Simple query to check Firestore connection
-            firebase_db.collection('users').limit(1).get()
-            health_status["services"]["firebase"] = "operational"
-        else:
-            health_status["status"] = "degraded"
-            health_status["services"]["firebase"] = "not initialized"
+            get_db().collection('users').limit(1).get()
+            _last_firestore_ok_ts = now
+        health_status["services"]["firebase"] = "operational"
     except Exception as e:
         health_status["status"] = "degraded"
         health_status["services"]["firebase"] = f"error: {str(e)}"
@@ -121,7 +224,7 @@ async def not_found_handler(request: Request, exc: HTTPException):
     """
     Handle 404 Not Found errors.
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=404,
         content={
             "error": "Not Found",
@@ -136,7 +239,7 @@ async def internal_error_handler(request: Request, exc: Exception):
     """
     Handle 500 Internal Server Error.
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal Server Error",
@@ -146,6 +249,16 @@ async def internal_error_handler(request: Request, exc: Exception):
     )
 
 
+# Firebase canonical error codes mapped to HTTP status codes
+FIREBASE_ERROR_STATUS_CODES = {
+    'NOT_FOUND': 404,
+    'UNAUTHENTICATED': 401,
+    'PERMISSION_DENIED': 401,
+    'ALREADY_EXISTS': 409,
+    'INVALID_ARGUMENT': 400,
+}
+
+
 @app.exception_handler(firebase_admin.exceptions.FirebaseError)
 async def firebase_error_handler(request: Request, exc: firebase_admin.exceptions.FirebaseError):
     """
@@ -155,17 +268,9 @@ async def firebase_error_handler(request: Request, exc: firebase_admin.exception
     error_message = str(exc)
     
     # Map Firebase errors to appropriate HTTP status codes
-    status_code = 500
-    if 'NOT_FOUND' in error_code:
-        status_code = 404
-    elif 'UNAUTHENTICATED' in error_code or 'PERMISSION_DENIED' in error_code:
-        status_code = 401
-    elif 'ALREADY_EXISTS' in error_code:
-        status_code = 409
-    elif 'INVALID_ARGUMENT' in error_code:
-        status_code = 400
+    status_code = FIREBASE_ERROR_STATUS_CODES.get(error_code, 500)
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content={
             "error": "Firebase Error",
@@ -181,7 +286,7 @@ async def global_exception_handler(request: Request, exc: Exception):
     """
     Global exception handler for all unhandled errors.
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal Server Error",
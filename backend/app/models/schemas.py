@@ -2,10 +2,122 @@
 Pydantic models for request/response validation
 """
 
-from pydantic import BaseModel, EmailStr, Field, ConfigDict, field_validator
-from typing import Optional, List, Any, Literal
+from pydantic import BaseModel, Field, ConfigDict, StringConstraints, AfterValidator, field_validator, model_validator
+from typing import Optional, List, Any, Literal, Annotated
 from datetime import datetime
 from enum import Enum
+from itertools import islice
+import re
+
+
+# Precompiled patterns shared by validators
+_DIGIT_RE = re.compile(r'\d')
+_WORD_RE = re.compile(r'\S+')
+_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+
+def _has_min_words(text: str, min_words: int) -> bool:
+    """Return True if text contains at least min_words words, stopping early once reached."""
+    return sum(1 for _ in islice(_WORD_RE.finditer(text), min_words)) >= min_words
+
+
+def _validate_email(value: str) -> str:
+    """
+    Lightweight syntactic email check; Firebase Auth performs the authoritative validation.
+    
+    The address is stripped and lower-cased, as Firebase Auth stores it, so
+    differently-cased spellings of one address compare equal.
+    """
+    value = value.strip().lower()
+    if not _EMAIL_RE.match(value):
+        raise ValueError('value is not a valid email address')
+    return value
+
+
+Email = Annotated[str, AfterValidator(_validate_email)]
+
+
+# OpenAPI examples, defined once and shared by the model configs below
+_EXAMPLES = {
+    "UserCreate": {
+        "name": "John Doe",
+        "email": "john.doe@example.com",
+        "password": "SecurePass123!"
+    },
+    "UserRegister": {
+        "name": "John Doe",
+        "email": "john.doe@example.com"
+    },
+    "UserLogin": {
+        "email": "john.doe@example.com",
+        "password": "SecurePass123!"
+    },
+    "UserResponse": {
+        "id": "user_123abc",
+        "name": "John Doe",
+        "email": "john.doe@example.com",
+        "created_at": "2025-12-28T10:30:00Z"
+    },
+    "StoryCreate": {
+        "title": "The Magical Forest Adventure",
+        "text_prompt": "Create a story about a young explorer who discovers a magical forest filled with talking animals and hidden treasures."
+    },
+    "StoryUpdate": {
+        "title": "The Enchanted Forest Adventure",
+        "text_prompt": "Create a story about a brave explorer discovering an enchanted forest with mystical creatures."
+    },
+    "StoryResponse": {
+        "id": "story_456xyz",
+        "user_id": "user_123abc",
+        "title": "The Magical Forest Adventure",
+        "text_prompt": "Create a story about a young explorer...",
+        "image_urls": [
+            "https://storage.example.com/story_456xyz/image_1.jpg",
+            "https://storage.example.com/story_456xyz/image_2.jpg"
+        ],
+        "video_url": "https://storage.example.com/story_456xyz/video.mp4",
+        "audio_url": "https://storage.example.com/story_456xyz/audio.mp3",
+        "created_at": "2025-12-28T10:30:00Z",
+        "updated_at": "2025-12-28T10:35:00Z"
+    },
+    "StoryListResponse": {
+        "stories": [
+            {
+                "id": "story_456xyz",
+                "user_id": "user_123abc",
+                "title": "The Magical Forest",
+                "text_prompt": "A story about...",
+                "image_urls": ["https://example.com/img1.jpg"],
+                "video_url": "https://example.com/video.mp4",
+                "audio_url": "https://example.com/audio.mp3",
+                "created_at": "2025-12-28T10:30:00Z",
+                "updated_at": "2025-12-28T10:35:00Z"
+            }
+        ],
+        "total": 1
+    },
+    "StoryReview": {
+        "story_id": "story_456xyz",
+        "rating": 5,
+        "feedback": "Amazing story! The images were beautiful and the narration was engaging."
+    },
+    "AdminAction": {
+        "action_type": "warn_user",
+        "target_user_id": "user_789def",
+        "reason": "Violation of community guidelines: inappropriate content in story."
+    },
+    "SuccessResponse": {
+        "message": "Operation completed successfully",
+        "data": {
+            "id": "123",
+            "status": "success"
+        }
+    },
+    "ErrorResponse": {
+        "error": "Validation failed",
+        "details": "Password must contain at least one uppercase letter"
+    }
+}
 
 
 # ========== Enums ==========
@@ -23,56 +135,39 @@ class ActionType(str, Enum):
 
 class UserCreate(BaseModel):
     """Model for user registration"""
-    name: str = Field(..., min_length=2, max_length=100, description="User's full name")
-    email: EmailStr = Field(..., description="User's email address")
+    name: Annotated[str, StringConstraints(strip_whitespace=True)] = Field(..., min_length=2, max_length=100, description="User's full name")
+    email: Email = Field(..., description="User's email address")
     password: str = Field(..., min_length=8, max_length=128, description="User's password")
     
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "name": "John Doe",
-                "email": "john.doe@example.com",
-                "password": "SecurePass123!"
-            }
-        }
-    )
+    model_config = ConfigDict(frozen=True, json_schema_extra={"example": _EXAMPLES["UserCreate"]})
     
-    @field_validator('name')
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        if not v.strip():
+    @model_validator(mode='after')
+    def validate_credentials(self) -> 'UserCreate':
+        # Name is already stripped by its StringConstraints
+        if not self.name:
             raise ValueError('Name cannot be empty or only whitespace')
-        if any(char.isdigit() for char in v):
+        if _DIGIT_RE.search(self.name):
             raise ValueError('Name should not contain numbers')
-        return v.strip()
-    
-    @field_validator('password')
-    @classmethod
-    def validate_password(cls, v: str) -> str:
-        if len(v) < 8:
+        
+        password = self.password
+        if len(password) < 8:
             raise ValueError('Password must be at least 8 characters long')
-        if not any(char.isupper() for char in v):
+        # Case conversions and the regex scan run in C instead of per-char Python loops
+        if password == password.lower():
             raise ValueError('Password must contain at least one uppercase letter')
-        if not any(char.islower() for char in v):
+        if password == password.upper():
             raise ValueError('Password must contain at least one lowercase letter')
-        if not any(char.isdigit() for char in v):
+        if not _DIGIT_RE.search(password):
             raise ValueError('Password must contain at least one number')
-        return v
+        return self
 
 
 class UserRegister(BaseModel):
     """Model for user registration (after Firebase Auth user is created)"""
     name: str = Field(..., min_length=2, max_length=100, description="User's full name")
-    email: EmailStr = Field(..., description="User's email address")
+    email: Email = Field(..., description="User's email address")
     
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "name": "John Doe",
-                "email": "john.doe@example.com"
-            }
-        }
-    )
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLES["UserRegister"]})
     
     @field_validator('name')
     @classmethod
@@ -84,41 +179,27 @@ class UserRegister(BaseModel):
 
 class UserLogin(BaseModel):
     """Model for user login"""
-    email: EmailStr = Field(..., description="User's email address")
+    email: Email = Field(..., description="User's email address")
     password: str = Field(..., description="User's password")
     
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "email": "john.doe@example.com",
-                "password": "SecurePass123!"
-            }
-        }
-    )
+    model_config = ConfigDict(frozen=True, json_schema_extra={"example": _EXAMPLES["UserLogin"]})
 
 
 class UserResponse(BaseModel):
     """Model for user response data"""
     id: str = Field(..., description="User's unique identifier")
     name: str = Field(..., description="User's full name")
-    email: EmailStr = Field(..., description="User's email address")
+    email: Email = Field(..., description="User's email address")
     created_at: datetime = Field(..., description="Account creation timestamp")
     
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "id": "user_123abc",
-                "name": "John Doe",
-                "email": "john.doe@example.com",
-                "created_at": "2025-12-28T10:30:00Z"
-            }
-        }
-    )
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLES["UserResponse"]})
 
 
 class TokenVerify(BaseModel):
     """Model for token verification"""
     token: str = Field(..., description="Firebase ID token")
+    
+    model_config = ConfigDict(frozen=True)
 
 
 # ========== Story Models ==========
@@ -128,14 +209,7 @@ class StoryCreate(BaseModel):
     title: str = Field(..., min_length=3, max_length=200, description="Story title")
     text_prompt: str = Field(..., min_length=10, max_length=1000, description="Story generation prompt")
     
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "title": "The Magical Forest Adventure",
-                "text_prompt": "Create a story about a young explorer who discovers a magical forest filled with talking animals and hidden treasures."
-            }
-        }
-    )
+    model_config = ConfigDict(frozen=True, json_schema_extra={"example": _EXAMPLES["StoryCreate"]})
     
     @field_validator('title')
     @classmethod
@@ -147,11 +221,12 @@ class StoryCreate(BaseModel):
     @field_validator('text_prompt')
     @classmethod
     def validate_text_prompt(cls, v: str) -> str:
-        if not v.strip():
+        v = v.strip()
+        if not v:
             raise ValueError('Text prompt cannot be empty or only whitespace')
-        if len(v.strip().split()) < 5:
+        if not _has_min_words(v, 5):
             raise ValueError('Text prompt must contain at least 5 words')
-        return v.strip()
+        return v
 
 
 class StoryUpdate(BaseModel):
@@ -159,14 +234,7 @@ class StoryUpdate(BaseModel):
     title: Optional[str] = Field(None, min_length=3, max_length=200, description="Story title")
     text_prompt: Optional[str] = Field(None, min_length=10, max_length=1000, description="Story generation prompt")
     
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "title": "The Enchanted Forest Adventure",
-                "text_prompt": "Create a story about a brave explorer discovering an enchanted forest with mystical creatures."
-            }
-        }
-    )
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLES["StoryUpdate"]})
     
     @field_validator('title')
     @classmethod
@@ -179,11 +247,12 @@ class StoryUpdate(BaseModel):
     @classmethod
     def validate_text_prompt(cls, v: Optional[str]) -> Optional[str]:
         if v is not None:
-            if not v.strip():
+            v = v.strip()
+            if not v:
                 raise ValueError('Text prompt cannot be empty or only whitespace')
-            if len(v.strip().split()) < 5:
+            if not _has_min_words(v, 5):
                 raise ValueError('Text prompt must contain at least 5 words')
-        return v.strip() if v else None
+        return v if v else None
 
 
 class StoryResponse(BaseModel):
@@ -200,24 +269,7 @@ class StoryResponse(BaseModel):
     created_at: datetime = Field(..., description="Story creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
     
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "id": "story_456xyz",
-                "user_id": "user_123abc",
-                "title": "The Magical Forest Adventure",
-                "text_prompt": "Create a story about a young explorer...",
-                "image_urls": [
-                    "https://storage.example.com/story_456xyz/image_1.jpg",
-                    "https://storage.example.com/story_456xyz/image_2.jpg"
-                ],
-                "video_url": "https://storage.example.com/story_456xyz/video.mp4",
-                "audio_url": "https://storage.example.com/story_456xyz/audio.mp3",
-                "created_at": "2025-12-28T10:30:00Z",
-                "updated_at": "2025-12-28T10:35:00Z"
-            }
-        }
-    )
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLES["StoryResponse"]})
 
 
 class StoryListResponse(BaseModel):
@@ -225,26 +277,7 @@ class StoryListResponse(BaseModel):
     stories: List[StoryResponse] = Field(..., description="List of stories")
     total: int = Field(..., ge=0, description="Total number of stories")
     
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "stories": [
-                    {
-                        "id": "story_456xyz",
-                        "user_id": "user_123abc",
-                        "title": "The Magical Forest",
-                        "text_prompt": "A story about...",
-                        "image_urls": ["https://example.com/img1.jpg"],
-                        "video_url": "https://example.com/video.mp4",
-                        "audio_url": "https://example.com/audio.mp3",
-                        "created_at": "2025-12-28T10:30:00Z",
-                        "updated_at": "2025-12-28T10:35:00Z"
-                    }
-                ],
-                "total": 1
-            }
-        }
-    )
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLES["StoryListResponse"]})
 
 
 # ========== Story Review Models ==========
@@ -255,15 +288,7 @@ class StoryReview(BaseModel):
     rating: int = Field(..., ge=1, le=5, description="Rating from 1 to 5 stars")
     feedback: Optional[str] = Field(None, max_length=1000, description="Optional review feedback")
     
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "story_id": "story_456xyz",
-                "rating": 5,
-                "feedback": "Amazing story! The images were beautiful and the narration was engaging."
-            }
-        }
-    )
+    model_config = ConfigDict(frozen=True, json_schema_extra={"example": _EXAMPLES["StoryReview"]})
     
     @field_validator('feedback')
     @classmethod
@@ -282,24 +307,17 @@ class AdminAction(BaseModel):
     target_user_id: str = Field(..., description="Target user's ID")
     reason: str = Field(..., min_length=10, max_length=500, description="Reason for the action")
     
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "action_type": "warn_user",
-                "target_user_id": "user_789def",
-                "reason": "Violation of community guidelines: inappropriate content in story."
-            }
-        }
-    )
+    model_config = ConfigDict(frozen=True, json_schema_extra={"example": _EXAMPLES["AdminAction"]})
     
     @field_validator('reason')
     @classmethod
     def validate_reason(cls, v: str) -> str:
-        if not v.strip():
+        v = v.strip()
+        if not v:
             raise ValueError('Reason cannot be empty or only whitespace')
-        if len(v.strip().split()) < 3:
+        if not _has_min_words(v, 3):
             raise ValueError('Reason must contain at least 3 words')
-        return v.strip()
+        return v
 
 
 # ========== Response Wrapper Models ==========
@@ -309,17 +327,7 @@ class SuccessResponse(BaseModel):
     message: str = Field(..., description="Success message")
     data: Optional[Any] = Field(None, description="Response data payload")
     
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "message": "Operation completed successfully",
-                "data": {
-                    "id": "123",
-                    "status": "success"
-                }
-            }
-        }
-    )
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLES["SuccessResponse"]})
 
 
 class ErrorResponse(BaseModel):
@@ -327,11 +335,4 @@ class ErrorResponse(BaseModel):
     error: str = Field(..., description="Error message")
     details: Optional[str] = Field(None, description="Additional error details")
     
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "error": "Validation failed",
-                "details": "Password must contain at least one uppercase letter"
-            }
-        }
-    )
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLES["ErrorResponse"]})
@@ -4,9 +4,10 @@ Admin Panel Routes
 Handles administrative functions including user management, content moderation, and audit logging.
 """
 
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Query
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from app.models.schemas import (
     UserResponse,
     AdminAction,
@@ -14,12 +15,30 @@ from app.models.schemas import (
     ErrorResponse
 )
 from app.config.firebase_config import get_auth, get_db, get_bucket
-from datetime import datetime
+from app.routes.auth import verify_id_token_cached, invalidate_user_cache
+from datetime import datetime, timedelta, timezone
+from google.api_core.exceptions import NotFound
+from firebase_admin.exceptions import InvalidArgumentError
+import asyncio
+import functools
+import logging
+import orjson
+import re
 import uuid
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 security = HTTPBearer()
 
+logger = logging.getLogger(__name__)
+
+# Maximum number of operations Firestore accepts in a single write batch
+FIRESTORE_BATCH_LIMIT = 500
+
+# Number of users whose metadata is fetched per get_all call when streaming
+USER_STREAM_CHUNK_SIZE = 25
+
+# Largest page Firebase Auth list_users will return in one RPC
+AUTH_LIST_USERS_MAX_RESULTS = 1000
 
 # ========== Admin Middleware ==========
 
@@ -39,8 +58,8 @@ async def check_admin_role(credentials: HTTPAuthorizationCredentials = Depends(s
     try:
         auth = get_auth()
         
-        # Verify the ID token
-        decoded_token = auth.verify_id_token(credentials.credentials)
+        # Verify the ID token (cached briefly per token)
+        decoded_token = await verify_id_token_cached(auth, credentials.credentials)
         
         # Check for admin custom claim
         if not decoded_token.get('admin', False):
@@ -60,41 +79,318 @@ async def check_admin_role(credentials: HTTPAuthorizationCredentials = Depends(s
         )
 
 
-async def _log_admin_action(
+# Pending admin log entries, drained in batches by run_admin_log_writer()
+ADMIN_LOG_FLUSH_SECONDS = 0.1
+_admin_log_queue: Optional[asyncio.Queue] = None
+
+
+def _log_admin_action(
     admin_id: str,
     action: str,
     target_user_id: Optional[str] = None,
     reason: Optional[str] = None,
-    details: Optional[Dict] = None
+    details: Optional[Dict] = None,
+    admin_name: Optional[str] = None,
+    target_user_name: Optional[str] = None,
+    batch=None
 ) -> None:
     """
     Log an admin action to the admin_logs collection.
     
+    The entry is queued for the background log writer so the request does not
+    wait on Firestore. If the writer is not running, the entry is written directly.
+    When a batch is given, the entry is added to it instead and is committed
+    together with the caller's other writes.
+    
     Args:
         admin_id: ID of the admin performing the action
         action: Type of action performed
         target_user_id: ID of the affected user (if applicable)
         reason: Reason for the action
         details: Additional details about the action
+        admin_name: Display name of the admin, stored so log reads need no lookup
+        target_user_name: Display name of the affected user (if applicable)
+        batch: Firestore WriteBatch to add the log write to (optional)
     """
+    log_id = uuid.uuid4().hex
+    
+    log_data = {
+        "id": log_id,
+        "admin_id": admin_id,
+        "admin_name": admin_name,
+        "action": action,
+        "target_user_id": target_user_id,
+        "target_user_name": target_user_name,
+        "reason": reason,
+        "details": details or {},
+        "timestamp": datetime.now(timezone.utc)
+    }
+    
+    if batch is not None:
+        batch.set(get_db().collection("admin_logs").document(log_id), log_data)
+        return
+    
+    if _admin_log_queue is not None:
+        _admin_log_queue.put_nowait(log_data)
+        return
+    
     try:
-        db = get_db()
-        log_id = str(uuid.uuid4())
-        
-        log_data = {
-            "id": log_id,
-            "admin_id": admin_id,
-            "action": action,
-            "target_user_id": target_user_id,
-            "reason": reason,
-            "details": details or {},
-            "timestamp": datetime.utcnow()
-        }
+        _write_admin_logs([log_data])
+    except Exception as e:
+        logger.warning("Failed to log admin action: %s", e, exc_info=True)
+
+
+def _write_admin_logs(entries: List[Dict[str, Any]]) -> None:
+    """
+    Write admin log entries to Firestore using write batches.
+    
+    Args:
+        entries: Log documents to write
+    """
+    db = get_db()
+    logs_ref = db.collection("admin_logs")
+    
+    for i in range(0, len(entries), FIRESTORE_BATCH_LIMIT):
+        batch = db.batch()
+        for log_data in entries[i:i + FIRESTORE_BATCH_LIMIT]:
+            batch.set(logs_ref.document(log_data["id"]), log_data)
+        batch.commit()
+
+
+async def run_admin_log_writer() -> None:
+    """
+    Background task that drains queued admin log entries into Firestore.
+    
+    Entries are committed in batches of up to 500, at most every 100ms.
+    Anything still queued when the task is cancelled is flushed before exiting.
+    """
+    global _admin_log_queue
+    queue = _admin_log_queue = asyncio.Queue()
+    entries: List[Dict[str, Any]] = []
+    
+    try:
+        while True:
+            entries.append(await queue.get())
+            
+            # Let more entries arrive before flushing. A plain sleep, because
+            # wait_for(queue.get()) can swallow a cancellation that races with
+            # an arriving entry (Python < 3.12), which would hang shutdown
+            await asyncio.sleep(ADMIN_LOG_FLUSH_SECONDS)
+            while len(entries) < FIRESTORE_BATCH_LIMIT and not queue.empty():
+                entries.append(queue.get_nowait())
+            
+            pending, entries = entries, []
+            try:
+                await asyncio.to_thread(_write_admin_logs, pending)
+            except Exception as e:
+                logger.exception("Failed to write %d admin logs", len(pending))
+    finally:
+        _admin_log_queue = None
+        while not queue.empty():
+            entries.append(queue.get_nowait())
+        if entries:
+            try:
+                _write_admin_logs(entries)
+            except Exception as e:
+                logger.exception("Failed to flush %d admin logs", len(entries))
+
+
+def _get_user_names(db, user_ids) -> Dict[str, Optional[str]]:
+    """
+    Look up display names for a set of user IDs with a single batched read.
+    
+    Args:
+        db: Firestore client
+        user_ids: Iterable of user IDs to resolve
+        
+    Returns:
+        Dict mapping each existing user's ID to their name
+    """
+    user_refs = [db.collection("users").document(uid) for uid in user_ids]
+    if not user_refs:
+        return {}
+    
+    return {
+        user_doc.id: user_doc.to_dict().get('name')
+        for user_doc in db.get_all(user_refs)
+        if user_doc.exists
+    }
+
+
+def _count(query) -> int:
+    """
+    Count documents matching a Firestore query using a server-side aggregation.
+    
+    Args:
+        query: Firestore collection reference or query
         
-        db.collection("admin_logs").document(log_id).set(log_data)
+    Returns:
+        Number of matching documents
+    """
+    return query.count().get()[0][0].value
+
+
+def _count_auth_users(auth) -> Tuple[int, int]:
+    """
+    Walk every Firebase Auth user page and count total and disabled users.
+    
+    Args:
+        auth: Firebase Auth module
         
-    except Exception as e:
-        print(f"Warning: Failed to log admin action: {str(e)}")
+    Returns:
+        Tuple of (total_users, disabled_users)
+    """
+    total_users = 0
+    disabled_users = 0
+    
+    users_page = auth.list_users(max_results=AUTH_LIST_USERS_MAX_RESULTS)
+    while users_page:
+        # ListUsersPage.users rebuilds its record list on every access
+        users = users_page.users
+        total_users += len(users)
+        disabled_users += sum(1 for user in users if user.disabled)
+        users_page = users_page.get_next_page()
+    
+    return total_users, disabled_users
+
+
+@functools.lru_cache(maxsize=8)
+def _blob_name_pattern(bucket_name: str) -> re.Pattern:
+    """
+    Compile the regex that extracts a blob name from a public URL in this bucket.
+    
+    Args:
+        bucket_name: Name of the storage bucket
+        
+    Returns:
+        Compiled pattern whose first group is the blob name
+    """
+    return re.compile(rf"/{re.escape(bucket_name)}/([^?#]+)")
+
+
+def _delete_blob(bucket, url: str) -> bool:
+    """
+    Delete a single storage blob referenced by a public URL.
+    
+    Args:
+        bucket: Firebase Storage bucket
+        url: Public URL of the file
+        
+    Returns:
+        True if the file was deleted, False otherwise
+    """
+    try:
+        match = _blob_name_pattern(bucket.name).search(url)
+        if not match:
+            logger.warning("Not a file in bucket %s: %s", bucket.name, url)
+            return False
+        bucket.blob(match.group(1)).delete()
+        return True
+    except NotFound:
+        pass
+    except Exception:
+        logger.warning("Failed to delete file %s", url, exc_info=True)
+    return False
+
+
+def _batch_delete(db, doc_refs: List[Any], batch=None, pending_writes: int = 0) -> None:
+    """
+    Delete Firestore documents using write batches of up to 500 operations.
+    
+    Args:
+        db: Firestore client
+        doc_refs: Document references to delete
+        batch: Batch that already holds other writes; it is filled and
+            committed first (optional)
+        pending_writes: Number of writes already in batch
+    """
+    if batch is None:
+        batch = db.batch()
+        pending_writes = 0
+    
+    for doc_ref in doc_refs:
+        if pending_writes == FIRESTORE_BATCH_LIMIT:
+            batch.commit()
+            batch = db.batch()
+            pending_writes = 0
+        batch.delete(doc_ref)
+        pending_writes += 1
+    
+    if pending_writes:
+        batch.commit()
+
+
+def _build_user_infos(db, users) -> List[Dict[str, Any]]:
+    """
+    Combine Firebase Auth users with their Firestore metadata.
+    
+    Args:
+        db: Firestore client
+        users: Firebase Auth user records
+        
+    Returns:
+        List of user info dicts, in the same order as users
+    """
+    user_metadata_by_id = {}
+    if users:
+        user_refs = [db.collection("users").document(user.uid) for user in users]
+        for user_doc in db.get_all(user_refs):
+            if user_doc.exists:
+                user_metadata_by_id[user_doc.id] = user_doc.to_dict()
+    
+    user_list = []
+    for user in users:
+        user_metadata = user_metadata_by_id.get(user.uid, {})
+        
+        user_list.append({
+            "id": user.uid,
+            "email": user.email,
+            "name": user_metadata.get('name', user.display_name),
+            "created_at": user_metadata.get('created_at'),
+            "disabled": user.disabled,
+            "email_verified": user.email_verified,
+            "stories_count": user_metadata.get('stories_count', 0),
+            "custom_claims": user.custom_claims or {}
+        })
+    
+    return user_list
+
+
+async def _stream_user_infos(db, users):
+    """
+    Yield user info as NDJSON lines, chunk by chunk in Firebase Auth order.
+    
+    Metadata reads for all chunks run concurrently; each chunk is sent as soon
+    as it and every chunk before it are loaded, so the output matches the
+    non-streamed response.
+    
+    Args:
+        db: Firestore client
+        users: Firebase Auth user records
+        
+    Yields:
+        One JSON-encoded user per line
+    """
+    chunks = [
+        users[i:i + USER_STREAM_CHUNK_SIZE]
+        for i in range(0, len(users), USER_STREAM_CHUNK_SIZE)
+    ]
+    tasks = [
+        asyncio.create_task(asyncio.to_thread(_build_user_infos, db, chunk))
+        for chunk in chunks
+    ]
+    
+    try:
+        for task in tasks:
+            for user_info in await task:
+                yield orjson.dumps(user_info, default=str) + b"\n"
+    except Exception:
+        # Headers are already sent, so the stream can only be cut short
+        logger.exception("Failed to stream users")
+    finally:
+        # Don't leave reads running if the client disconnects or a chunk fails
+        for task in tasks:
+            task.cancel()
 
 
 # ========== Admin Authentication ==========
@@ -118,14 +414,15 @@ async def admin_login(token_data: Dict[str, Any] = Depends(check_admin_role)):
         admin_id = token_data['uid']
         
         # Get admin user data
-        user_doc = db.collection("users").document(admin_id).get()
+        user_doc = await asyncio.to_thread(db.collection("users").document(admin_id).get)
         user_data = user_doc.to_dict() if user_doc.exists else {}
         
         # Log admin login
-        await _log_admin_action(
+        _log_admin_action(
             admin_id=admin_id,
             action="admin_login",
-            details={"email": token_data.get('email')}
+            details={"email": token_data.get('email')},
+            admin_name=user_data.get('name')
         )
         
         return SuccessResponse(
@@ -149,78 +446,80 @@ async def admin_login(token_data: Dict[str, Any] = Depends(check_admin_role)):
 
 @router.get("/users", response_model=SuccessResponse)
 async def list_all_users(
-    page: int = 1,
-    limit: int = 20,
+    page_token: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    stream: bool = False,
+    page: Optional[str] = Query(None, include_in_schema=False),
     token_data: Dict[str, Any] = Depends(check_admin_role)
 ):
     """
     List all users with pagination.
     
     Requires admin privileges. Returns users from Firebase Auth with Firestore metadata.
+    With stream=true the users are sent as NDJSON (one user per line) as soon as
+    each chunk's metadata is loaded, and the next page token is returned in the
+    X-Next-Page-Token header.
     
     Args:
-        page: Page number (default: 1)
+        page_token: Opaque cursor from a previous response's next_page_token
         limit: Number of users per page (default: 20, max: 100)
+        stream: Stream users as NDJSON instead of a single JSON body
+        page: Legacy page number, rejected in favour of page_token
         token_data: Decoded admin token
         
     Returns:
-        SuccessResponse with paginated user list and metadata
+        SuccessResponse with paginated user list and metadata, or a
+        StreamingResponse of NDJSON users when stream is set
+        
+    Raises:
+        HTTPException: 400 if the legacy page parameter or an invalid page token is sent
     """
+    # Silently serving page 1 to old clients would hide the pagination change
+    if page is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The page parameter is no longer supported; use page_token from next_page_token"
+        )
+    
     try:
         auth = get_auth()
         db = get_db()
         
-        # Validate pagination parameters
-        if page < 1:
+        # Fetch the requested page directly from Firebase Auth using its cursor
+        try:
+            users_page = await asyncio.to_thread(
+                auth.list_users, max_results=limit, page_token=page_token
+            )
+        except (ValueError, InvalidArgumentError):
+            # ValueError for an empty token (checked locally), InvalidArgumentError
+            # for a malformed one (rejected by the Auth server)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Page must be at least 1"
+                detail="Invalid page token"
             )
         
-        if limit < 1 or limit > 100:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Limit must be between 1 and 100"
+        # ListUsersPage.users rebuilds its record list on every access, so read it once
+        users = users_page.users
+        
+        if stream:
+            headers = {}
+            if users_page.next_page_token:
+                headers["X-Next-Page-Token"] = users_page.next_page_token
+            return StreamingResponse(
+                _stream_user_infos(db, users),
+                media_type="application/x-ndjson",
+                headers=headers
             )
         
-        # Get users from Firebase Auth with pagination
-        # Note: Firebase Admin SDK uses max_results and page_token for pagination
-        users_page = auth.list_users(max_results=limit)
-        
-        # Skip to requested page
-        current_page = 1
-        while current_page < page and users_page.has_next_page:
-            users_page = users_page.get_next_page()
-            current_page += 1
-        
-        # Build user list with metadata from Firestore
-        user_list = []
-        for user in users_page.users:
-            # Get additional metadata from Firestore
-            user_doc = db.collection("users").document(user.uid).get()
-            user_metadata = user_doc.to_dict() if user_doc.exists else {}
-            
-            # Count user's stories
-            stories_count = len(list(db.collection("stories").where("user_id", "==", user.uid).stream()))
-            
-            user_info = {
-                "id": user.uid,
-                "email": user.email,
-                "name": user_metadata.get('name', user.display_name),
-                "created_at": user_metadata.get('created_at'),
-                "disabled": user.disabled,
-                "email_verified": user.email_verified,
-                "stories_count": stories_count,
-                "custom_claims": user.custom_claims or {}
-            }
-            user_list.append(user_info)
+        # Fetch Firestore metadata for the whole page in one batched read
+        user_list = await asyncio.to_thread(_build_user_infos, db, users)
         
         return SuccessResponse(
             message=f"Retrieved {len(user_list)} users",
             data={
                 "users": user_list,
-                "page": page,
                 "limit": limit,
+                "next_page_token": users_page.next_page_token or None,
                 "has_next_page": users_page.has_next_page,
                 "total_retrieved": len(user_list)
             }
@@ -281,7 +580,7 @@ async def block_user(
         
         # Get user to verify they exist
         try:
-            user = auth.get_user(user_id)
+            user = await asyncio.to_thread(auth.get_user, user_id)
         except Exception:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -296,15 +595,17 @@ async def block_user(
             )
         
         # Disable the user account
-        auth.update_user(user_id, disabled=True)
+        await asyncio.to_thread(auth.update_user, user_id, disabled=True)
         
         # Log the action
-        await _log_admin_action(
+        _log_admin_action(
             admin_id=admin_id,
             action=action.action_type.value,
             target_user_id=user_id,
             reason=action.reason,
-            details={"email": user.email}
+            details={"email": user.email},
+            admin_name=token_data.get('name'),
+            target_user_name=user.display_name
         )
         
         return SuccessResponse(
@@ -366,7 +667,7 @@ async def unblock_user(
         
         # Get user to verify they exist
         try:
-            user = auth.get_user(user_id)
+            user = await asyncio.to_thread(auth.get_user, user_id)
         except Exception:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -374,15 +675,17 @@ async def unblock_user(
             )
         
         # Enable the user account
-        auth.update_user(user_id, disabled=False)
+        await asyncio.to_thread(auth.update_user, user_id, disabled=False)
         
         # Log the action
-        await _log_admin_action(
+        _log_admin_action(
             admin_id=admin_id,
             action=action.action_type.value,
             target_user_id=user_id,
             reason=action.reason,
-            details={"email": user.email}
+            details={"email": user.email},
+            admin_name=token_data.get('name'),
+            target_user_name=user.display_name
         )
         
         return SuccessResponse(
@@ -455,7 +758,7 @@ async def delete_user(
         
         # Get user to verify they exist
         try:
-            user = auth.get_user(user_id)
+            user = await asyncio.to_thread(auth.get_user, user_id)
         except Exception:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -469,52 +772,38 @@ async def delete_user(
                 detail="Cannot delete another admin account"
             )
         
-        # Delete all user's stories and media
-        stories_ref = db.collection("stories").where("user_id", "==", user_id)
-        deleted_stories = 0
-        deleted_files = 0
+        # Collect all user's stories and their media
+        story_docs = await asyncio.to_thread(
+            list, db.collection("stories").where("user_id", "==", user_id).stream()
+        )
+        media_urls = []
         
-        for story_doc in stories_ref.stream():
+        for story_doc in story_docs:
             story_data = story_doc.to_dict()
-            
-            # Delete media files from storage
-            media_urls = story_data.get("image_urls", [])
+            media_urls.extend(story_data.get("image_urls", []))
             if story_data.get("audio_url"):
                 media_urls.append(story_data["audio_url"])
             if story_data.get("video_url"):
                 media_urls.append(story_data["video_url"])
-            
-            for url in media_urls:
-                try:
-                    blob_name = url.split(f"{bucket.name}/")[-1].split("?")[0]
-                    blob = bucket.blob(blob_name)
-                    if blob.exists():
-                        blob.delete()
-                        deleted_files += 1
-                except Exception as e:
-                    print(f"Warning: Failed to delete file: {str(e)}")
-            
-            # Delete story document
-            story_doc.reference.delete()
-            deleted_stories += 1
-        
-        # Delete user's reviews
-        reviews_ref = db.collection("reviews").where("user_id", "==", user_id)
-        deleted_reviews = 0
-        for review_doc in reviews_ref.stream():
-            review_doc.reference.delete()
-            deleted_reviews += 1
-        
-        # Delete user document from Firestore
-        user_doc_ref = db.collection("users").document(user_id)
-        if user_doc_ref.get().exists:
-            user_doc_ref.delete()
         
-        # Delete user from Firebase Auth
-        auth.delete_user(user_id)
+        # Delete media files from storage concurrently
+        results = await asyncio.gather(
+            *(asyncio.to_thread(_delete_blob, bucket, url) for url in media_urls)
+        )
+        deleted_files = sum(results)
         
-        # Log the action
-        await _log_admin_action(
+        # Collect user's reviews
+        review_docs = await asyncio.to_thread(
+            list, db.collection("reviews").where("user_id", "==", user_id).stream()
+        )
+        
+        deleted_stories = len(story_docs)
+        deleted_reviews = len(review_docs)
+        
+        # Log the action in the same batch as the user document delete,
+        # so the audit record commits atomically with it
+        batch = db.batch()
+        _log_admin_action(
             admin_id=admin_id,
             action="delete_user",
             target_user_id=user_id,
@@ -524,9 +813,22 @@ async def delete_user(
                 "stories_deleted": deleted_stories,
                 "files_deleted": deleted_files,
                 "reviews_deleted": deleted_reviews
-            }
+            },
+            admin_name=token_data.get('name'),
+            target_user_name=user.display_name,
+            batch=batch
         )
         
+        # Delete the user document, stories and reviews in batched commits
+        doc_refs = [db.collection("users").document(user_id)]
+        doc_refs.extend(doc.reference for doc in story_docs)
+        doc_refs.extend(doc.reference for doc in review_docs)
+        await asyncio.to_thread(_batch_delete, db, doc_refs, batch, 1)
+        
+        # Delete user from Firebase Auth
+        await asyncio.to_thread(auth.delete_user, user_id)
+        invalidate_user_cache(user_id)
+        
         return SuccessResponse(
             message=f"User {user.email} has been permanently deleted",
             data={
@@ -551,9 +853,10 @@ async def delete_user(
 
 @router.get("/logs", response_model=SuccessResponse)
 async def get_admin_logs(
-    page: int = 1,
-    limit: int = 50,
+    start_after: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
     action_type: Optional[str] = None,
+    page: Optional[str] = Query(None, include_in_schema=False),
     token_data: Dict[str, Any] = Depends(check_admin_role)
 ):
     """
@@ -562,62 +865,82 @@ async def get_admin_logs(
     Requires admin privileges. Returns audit trail of admin actions.
     
     Args:
-        page: Page number (default: 1)
+        start_after: ID of the last log from the previous page (optional)
         limit: Number of logs per page (default: 50, max: 200)
         action_type: Filter by action type (optional)
+        page: Legacy page number, rejected in favour of start_after
         token_data: Decoded admin token
         
     Returns:
         SuccessResponse with paginated admin logs
+        
+    Raises:
+        HTTPException: 400 if the legacy page parameter or an unknown cursor is sent
     """
+    # Silently serving page 1 to old clients would hide the pagination change
+    if page is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The page parameter is no longer supported; use start_after from next_cursor"
+        )
+    
     try:
         db = get_db()
         
-        # Validate pagination parameters
-        if page < 1:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Page must be at least 1"
-            )
-        
-        if limit < 1 or limit > 200:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Limit must be between 1 and 200"
-            )
-        
         # Build query
-        logs_ref = db.collection("admin_logs").order_by("timestamp", direction="DESCENDING")
+        logs_ref = db.collection("admin_logs")
         
         # Apply action type filter if provided
         if action_type:
             logs_ref = logs_ref.where("action", "==", action_type)
         
-        # Get all logs for pagination
-        all_logs = list(logs_ref.stream())
-        total = len(all_logs)
+        total = await asyncio.to_thread(_count, logs_ref)
         
-        # Calculate offset
-        offset = (page - 1) * limit
+        # Fetch one extra log to learn whether another page follows
+        query = logs_ref.order_by("timestamp", direction="DESCENDING").limit(limit + 1)
         
-        # Apply pagination
-        paginated_logs = all_logs[offset:offset + limit]
+        # Resume after the cursor document from the previous page
+        if start_after:
+            cursor_doc = await asyncio.to_thread(
+                db.collection("admin_logs").document(start_after).get
+            )
+            if not cursor_doc.exists:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid start_after cursor"
+                )
+            query = query.start_after(cursor_doc)
+        
+        paginated_logs = await asyncio.to_thread(list, query.stream())
+        has_next_page = len(paginated_logs) > limit
+        paginated_logs = paginated_logs[:limit]
+        
+        log_entries = [log_doc.to_dict() for log_doc in paginated_logs]
+        
+        # Names are stored on each log at write time; only logs written before
+        # that need a (batched) lookup
+        user_ids = {
+            log_data['admin_id'] for log_data in log_entries
+            if 'admin_name' not in log_data
+        }
+        user_ids.update(
+            log_data['target_user_id'] for log_data in log_entries
+            if log_data.get('target_user_id') and 'target_user_name' not in log_data
+        )
+        user_names = await asyncio.to_thread(_get_user_names, db, user_ids)
         
         # Convert to list of dicts
         log_list = []
-        for log_doc in paginated_logs:
-            log_data = log_doc.to_dict()
-            
-            # Get admin name
-            admin_doc = db.collection("users").document(log_data['admin_id']).get()
-            admin_name = admin_doc.to_dict().get('name', 'Unknown') if admin_doc.exists else 'Unknown'
+        for log_data in log_entries:
+            if 'admin_name' in log_data:
+                admin_name = log_data['admin_name'] or 'Unknown'
+            else:
+                admin_name = user_names.get(log_data['admin_id']) or 'Unknown'
             
-            # Get target user info if applicable
-            target_user_name = None
-            if log_data.get('target_user_id'):
-                target_doc = db.collection("users").document(log_data['target_user_id']).get()
-                if target_doc.exists:
-                    target_user_name = target_doc.to_dict().get('name')
+            if 'target_user_name' in log_data:
+                target_user_name = log_data['target_user_name']
+            else:
+                target_user_name = user_names.get(log_data.get('target_user_id'))
             
             log_list.append({
                 "id": log_data['id'],
@@ -635,10 +958,10 @@ async def get_admin_logs(
             message=f"Retrieved {len(log_list)} admin logs",
             data={
                 "logs": log_list,
-                "page": page,
                 "limit": limit,
                 "total": total,
-                "has_next_page": (offset + limit) < total
+                "next_cursor": paginated_logs[-1].id if has_next_page else None,
+                "has_next_page": has_next_page
             }
         )
         
@@ -670,44 +993,30 @@ async def get_admin_stats(token_data: Dict[str, Any] = Depends(check_admin_role)
         auth = get_auth()
         db = get_db()
         
-        # Count total users
-        users_page = auth.list_users()
-        total_users = 0
-        disabled_users = 0
-        
-        for user in users_page.users:
-            total_users += 1
-            if user.disabled:
-                disabled_users += 1
-        
-        while users_page.has_next_page:
-            users_page = users_page.get_next_page()
-            for user in users_page.users:
-                total_users += 1
-                if user.disabled:
-                    disabled_users += 1
-        
-        # Count total stories
         stories_ref = db.collection("stories")
-        all_stories = list(stories_ref.stream())
-        total_stories = len(all_stories)
-        
-        # Count stories by status
-        completed_stories = sum(1 for s in all_stories if s.to_dict().get('status') == 'completed')
-        processing_stories = sum(1 for s in all_stories if s.to_dict().get('status') == 'processing')
-        failed_stories = sum(1 for s in all_stories if s.to_dict().get('status') == 'failed')
-        
-        # Count total reviews
-        reviews_ref = db.collection("reviews")
-        total_reviews = len(list(reviews_ref.stream()))
         
         # Count admin actions in last 30 days
-        from datetime import timedelta
-        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-        
-        recent_actions = 0
-        logs_ref = db.collection("admin_logs").where("timestamp", ">=", thirty_days_ago)
-        recent_actions = len(list(logs_ref.stream()))
+        thirty_days_ago = datetime.now(timezone.utc) - timedelta(days=30)
+        
+        # Run the Auth user scan and all Firestore count() aggregations concurrently,
+        # so total latency is that of the slowest call rather than their sum
+        (
+            (total_users, disabled_users),
+            total_stories,
+            completed_stories,
+            processing_stories,
+            failed_stories,
+            total_reviews,
+            recent_actions,
+        ) = await asyncio.gather(
+            asyncio.to_thread(_count_auth_users, auth),
+            asyncio.to_thread(_count, stories_ref),
+            asyncio.to_thread(_count, stories_ref.where("status", "==", "completed")),
+            asyncio.to_thread(_count, stories_ref.where("status", "==", "processing")),
+            asyncio.to_thread(_count, stories_ref.where("status", "==", "failed")),
+            asyncio.to_thread(_count, db.collection("reviews")),
+            asyncio.to_thread(_count, db.collection("admin_logs").where("timestamp", ">=", thirty_days_ago)),
+        )
         
         return SuccessResponse(
             message="Platform statistics retrieved successfully",
@@ -14,10 +14,19 @@ from app.models.schemas import (
     SuccessResponse,
     ErrorResponse
 )
-from app.config.firebase_config import get_auth, get_db
-from datetime import datetime
-from typing import Dict, Any
+from app.config.firebase_config import get_auth, get_async_db
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional
+from cachetools import TTLCache
+from google.api_core.exceptions import AlreadyExists
+from firebase_admin.auth import ExpiredIdTokenError
+import asyncio
+import base64
+import hashlib
+import json
 import jwt
+import os
+import threading
 import time
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
@@ -26,6 +35,144 @@ security = HTTPBearer()
 # Simple JWT secret (in production, use environment variable)
 JWT_SECRET = "your-secret-key-change-this-in-production"
 JWT_ALGORITHM = "HS256"
+JWT_SECRET_BYTES = JWT_SECRET.encode()  # Encoded once instead of on every decode
+
+# Include the underlying verification error in 401 responses (for local debugging only)
+DEBUG_AUTH = os.getenv("DEBUG_AUTH") == "1"
+
+# Prebuilt 401 responses for the common token failures; FastAPI only reads their fields
+_TOKEN_EXPIRED = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Token has expired"
+)
+_INVALID_TOKEN = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Invalid authentication token"
+)
+
+# Verified Firebase ID tokens, keyed by SHA-256 of the token (the raw token is never stored).
+# Values are (decoded_token, expires_at) so entries never outlive the token itself.
+TOKEN_CACHE_TTL_SECONDS = 60
+_token_cache: TTLCache = TTLCache(maxsize=10000, ttl=TOKEN_CACHE_TTL_SECONDS)
+_token_cache_lock = threading.Lock()
+
+
+async def verify_id_token_cached(auth, id_token: str) -> Dict[str, Any]:
+    """
+    Verify a Firebase ID token, reusing recent verifications of the same token.
+    
+    Args:
+        auth: Firebase Auth module
+        id_token: Raw Firebase ID token
+        
+    Returns:
+        Decoded token claims
+        
+    Raises:
+        Exception: Whatever auth.verify_id_token raises for an invalid token
+    """
+    cache_key = hashlib.sha256(id_token.encode()).digest()
+    now = time.time()
+    
+    with _token_cache_lock:
+        cached = _token_cache.get(cache_key)
+        if cached and cached[1] <= now:
+            # Past the token's own exp: drop it and verify again
+            del _token_cache[cache_key]
+            cached = None
+    if cached:
+        return cached[0]
+    
+    decoded_token = await asyncio.to_thread(auth.verify_id_token, id_token)
+    
+    # Only cache tokens that carry an expiry, and never past that expiry
+    exp = decoded_token.get('exp')
+    if isinstance(exp, (int, float)) and exp > now:
+        expires_at = min(now + TOKEN_CACHE_TTL_SECONDS, exp)
+        with _token_cache_lock:
+            _token_cache[cache_key] = (decoded_token, expires_at)
+    
+    return decoded_token
+
+
+def warm_public_keys() -> None:
+    """
+    Make the Firebase Auth token verifier fetch and cache Google's public keys.
+    
+    Verifies a throwaway token whose claims pass the verifier's pre-checks, so the
+    certificate fetch happens at startup rather than on the first real request.
+    The token itself is always rejected.
+    """
+    project_id = os.getenv('FIREBASE_PROJECT_ID')
+    if not project_id:
+        return
+    
+    now = int(time.time())
+    header = {"alg": "RS256", "kid": "warmup", "typ": "JWT"}
+    claims = {
+        "aud": project_id,
+        "iss": f"https://securetoken.google.com/{project_id}",
+        "sub": "warmup",
+        "iat": now,
+        "auth_time": now,
+        "exp": now + 300
+    }
+    segments = [
+        base64.urlsafe_b64encode(json.dumps(part).encode()).rstrip(b"=")
+        for part in (header, claims)
+    ]
+    token = b".".join(segments + [b"c2lnbmF0dXJl"]).decode()
+    
+    try:
+        get_auth().verify_id_token(token)
+    except Exception:
+        pass
+
+
+# Firestore user profiles by uid, for the read-mostly /me and /verify endpoints
+USER_CACHE_TTL_SECONDS = 60
+USER_PROFILE_FIELDS = ["name", "email", "created_at"]
+_user_cache: TTLCache = TTLCache(maxsize=5000, ttl=USER_CACHE_TTL_SECONDS)
+_user_cache_lock = threading.Lock()
+
+
+async def _get_user_data(db, uid: str) -> Optional[Dict[str, Any]]:
+    """
+    Fetch a user's Firestore profile, served from a short-lived cache when possible.
+    
+    Only the fields in USER_PROFILE_FIELDS are read from Firestore.
+    
+    Args:
+        db: Async Firestore client
+        uid: User ID
+        
+    Returns:
+        User document data, or None if the user has no profile
+    """
+    with _user_cache_lock:
+        user_data = _user_cache.get(uid)
+    if user_data is not None:
+        return user_data
+    
+    user_doc = await db.collection("users").document(uid).get(field_paths=USER_PROFILE_FIELDS)
+    if not user_doc.exists:
+        return None
+    
+    user_data = user_doc.to_dict()
+    with _user_cache_lock:
+        _user_cache[uid] = user_data
+    return user_data
+
+
+def invalidate_user_cache(uid: str) -> None:
+    """
+    Drop a user's cached profile after it is created, changed or deleted.
+    
+    Args:
+        uid: User ID
+    """
+    with _user_cache_lock:
+        _user_cache.pop(uid, None)
 
 
 # ========== Middleware / Dependencies ==========
@@ -47,25 +194,39 @@ async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(secur
         token = credentials.credentials
         auth = get_auth()
         
-        # Verify Firebase ID token
         try:
-            decoded_token = auth.verify_id_token(token)
-            return decoded_token
-        except Exception as firebase_error:
-            # If Firebase token verification fails, try JWT (for backward compatibility)
+            header = jwt.get_unverified_header(token)
+        except jwt.InvalidTokenError:
+            raise _INVALID_TOKEN
+        
+        # Dispatch on the header so each token is verified exactly once:
+        # legacy tokens are checked locally, Firebase ID tokens (RS256 with a
+        # key ID) by Firebase, and anything else is rejected outright
+        algorithm = header.get('alg')
+        
+        if algorithm == JWT_ALGORITHM:
             try:
-                payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
-                return payload
+                return jwt.decode(token, JWT_SECRET_BYTES, algorithms=[JWT_ALGORITHM])
             except jwt.ExpiredSignatureError:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Token has expired"
-                )
+                raise _TOKEN_EXPIRED
             except jwt.InvalidTokenError:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail=f"Invalid authentication token: {str(firebase_error)}"
-                )
+                raise _INVALID_TOKEN
+        
+        if algorithm != 'RS256' or not header.get('kid'):
+            raise _INVALID_TOKEN
+        
+        # Verify Firebase ID token (cached briefly per token)
+        try:
+            return await verify_id_token_cached(auth, token)
+        except ExpiredIdTokenError:
+            raise _TOKEN_EXPIRED
+        except Exception as firebase_error:
+            if not DEBUG_AUTH:
+                raise _INVALID_TOKEN
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=f"Invalid authentication token: {firebase_error!r}"
+            )
     except HTTPException:
         raise
     except Exception as e:
@@ -100,39 +261,43 @@ async def register_user(
     """
     try:
         auth = get_auth()
-        db = get_db()
+        db = get_async_db()
         
         # Verify Firebase ID token and get user ID
         token = credentials.credentials
-        decoded_token = auth.verify_id_token(token)
+        decoded_token = await verify_id_token_cached(auth, token)
         user_id = decoded_token['uid']
         user_email = decoded_token.get('email')
         
-        # Verify the email matches
-        if user_email != user.email:
+        # Verify the email matches (user.email is already lower-cased)
+        if (user_email or '').lower() != user.email:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email mismatch between token and request"
             )
         
-        # Check if user already exists in Firestore
         user_ref = db.collection("users").document(user_id)
-        if user_ref.get().exists:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="User already registered in database"
-            )
         
         # Store user data in Firestore 'users' collection
+        now = datetime.now(timezone.utc)
         user_data = {
             "id": user_id,
             "name": user.name,
             "email": user.email,
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
+            "created_at": now,
+            "updated_at": now
         }
         
-        user_ref.set(user_data)
+        # create() fails server-side if the document already exists,
+        # so no separate existence read is needed
+        try:
+            await user_ref.create(user_data)
+        except AlreadyExists:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="User already registered in database"
+            )
+        invalidate_user_cache(user_id)
         
         # Return user response
         return SuccessResponse(
@@ -141,7 +306,7 @@ async def register_user(
                 "id": user_id,
                 "name": user.name,
                 "email": user.email,
-                "created_at": user_data["created_at"].isoformat()
+                "created_at": now
             }
         )
         
@@ -177,11 +342,11 @@ async def login_user(user: UserLogin):
     """
     try:
         auth = get_auth()
-        db = get_db()
+        db = get_async_db()
         
         # Get user by email to verify they exist in Firebase Auth
         try:
-            user_record = auth.get_user_by_email(user.email)
+            user_record = await asyncio.to_thread(auth.get_user_by_email, user.email)
         except Exception:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -193,8 +358,7 @@ async def login_user(user: UserLogin):
         # This endpoint just confirms the user exists in Firebase
         
         # Get additional user data from Firestore
-        user_doc = db.collection("users").document(user_record.uid).get()
-        user_data = user_doc.to_dict() if user_doc.exists else {}
+        user_data = await _get_user_data(db, user_record.uid) or {}
         
         return SuccessResponse(
             message="User exists. Please use Firebase Client SDK for authentication.",
@@ -229,25 +393,23 @@ async def get_current_user(token_data: Dict[str, Any] = Depends(verify_token)):
         UserResponse with current user information
     """
     try:
-        db = get_db()
+        db = get_async_db()
         uid = token_data['uid']
         
         # Get user data from Firestore
-        user_doc = db.collection("users").document(uid).get()
+        user_data = await _get_user_data(db, uid)
         
-        if not user_doc.exists:
+        if user_data is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
         
-        user_data = user_doc.to_dict()
-        
         return UserResponse(
             id=uid,
             name=user_data.get('name', ''),
             email=user_data.get('email', token_data.get('email', '')),
-            created_at=user_data.get('created_at', datetime.utcnow())
+            created_at=user_data.get('created_at', datetime.now(timezone.utc))
         )
         
     except HTTPException:
@@ -274,19 +436,19 @@ async def verify_user_token(token_data: Dict[str, Any] = Depends(verify_token)):
         SuccessResponse with decoded token information
     """
     try:
-        db = get_db()
+        db = get_async_db()
         uid = token_data['uid']
         
-        # Get user data from Firestore
-        user_doc = db.collection("users").document(uid).get()
-        user_data = user_doc.to_dict() if user_doc.exists else {}
+        # Only the name is needed from the (cached, projected) profile
+        user_data = await _get_user_data(db, uid)
+        name = user_data.get('name') if user_data else None
         
         return SuccessResponse(
             message="Token verified successfully",
             data={
                 "uid": uid,
                 "email": token_data.get('email'),
-                "name": user_data.get('name'),
+                "name": name,
                 "token_valid": True,
                 "exp": token_data.get('exp'),  # Token expiration
                 "iat": token_data.get('iat')   # Token issued at
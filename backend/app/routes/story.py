@@ -5,7 +5,7 @@ Handles story generation, retrieval, and management with image, audio, and video
 """
 
 from fastapi import APIRouter, HTTPException, status, Depends, BackgroundTasks
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from app.models.schemas import (
     StoryCreate,
     StoryUpdate,
@@ -15,19 +15,45 @@ from app.models.schemas import (
     SuccessResponse
 )
 from app.config.firebase_config import get_db, get_bucket
+from firebase_admin import firestore
+from google.api_core.exceptions import NotFound
 from app.routes.auth import verify_token
 from app.services.image_service import image_service
 from app.services.audio_service import audio_service
 from app.services.video_service import video_service
 from app.services.cloudinary_service import cloudinary_service
-from datetime import datetime
+from datetime import datetime, timezone
+import asyncio
+import logging
 import uuid
 import os
 import re
+import shutil
 from pathlib import Path
+from urllib.parse import urlparse
 
 router = APIRouter(prefix="/story", tags=["Story"])
 
+logger = logging.getLogger(__name__)
+
+# Maximum number of scene images requested from the image API at once
+IMAGE_GENERATION_CONCURRENCY = 5
+
+# Maximum number of story generation pipelines running at once per process;
+# further generations wait their turn so the API stays responsive
+MAX_CONCURRENT_GENERATIONS = int(os.getenv("MAX_CONCURRENT_GENERATIONS", "2"))
+_generation_slots = asyncio.Semaphore(MAX_CONCURRENT_GENERATIONS)
+
+# Maximum number of operations Firestore accepts in a single write batch
+FIRESTORE_BATCH_LIMIT = 500
+
+# Story document fields returned to clients; internal bookkeeping such as
+# cloudinary_ids is left out of story reads
+STORY_RESPONSE_FIELDS = list(StoryResponse.model_fields)
+
+# Sentence boundary: whitespace following terminal punctuation
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
 
 # ========== Helper Functions ==========
 
@@ -49,21 +75,19 @@ def _split_text_into_scenes(text: str, max_scenes: int = 5) -> List[str]:
         return paragraphs
     
     # If too many or too few paragraphs, split by sentences
-    sentences = re.split(r'(?<=[.!?])\s+', text.strip())
+    sentences = _SENTENCE_SPLIT_RE.split(text.strip())
     
     if len(sentences) <= max_scenes:
         return sentences
     
-    # Combine sentences to create roughly equal scenes
-    scenes_per_chunk = len(sentences) // max_scenes
-    scenes = []
-    
-    for i in range(0, len(sentences), scenes_per_chunk):
-        scene = ' '.join(sentences[i:i + scenes_per_chunk])
-        if scene:
-            scenes.append(scene)
+    # Combine sentences into max_scenes balanced scenes; every sentence is kept
+    count = len(sentences)
+    boundaries = [i * count // max_scenes for i in range(max_scenes + 1)]
     
-    return scenes[:max_scenes]
+    return [
+        ' '.join(sentences[boundaries[i]:boundaries[i + 1]])
+        for i in range(max_scenes)
+    ]
 
 
 def _generate_scene_image_prompt(scene_text: str, story_title: str) -> str:
@@ -100,8 +124,13 @@ async def _upload_file_to_storage(local_path: str, storage_path: str) -> str:
     try:
         bucket = get_bucket()
         blob = bucket.blob(storage_path)
-        blob.upload_from_filename(local_path)
-        blob.make_public()
+        # Grant public read in the upload request itself instead of a
+        # follow-up make_public() round-trip
+        await asyncio.to_thread(
+            blob.upload_from_filename,
+            local_path,
+            predefined_acl="publicRead"
+        )
         return blob.public_url
     except Exception as e:
         raise Exception(f"Failed to upload file to storage: {str(e)}")
@@ -125,6 +154,90 @@ def _verify_story_ownership(story_data: Dict, user_id: str) -> None:
         )
 
 
+def _add_stories_count_update(db, batch, user_id: str, delta: int) -> None:
+    """
+    Add an update of the denormalized stories_count on a user's document to a batch.
+    
+    The counter lets the admin user listing read story counts without
+    querying the stories collection. It is written in the same batch as the
+    story create or delete so the two never drift apart. Users without a
+    profile document are skipped, so no stub profile is created that would
+    make a later registration fail.
+    
+    Args:
+        db: Firestore client
+        batch: Firestore WriteBatch holding the story write
+        user_id: Owner of the story
+        delta: Amount to add (negative to subtract)
+    """
+    user_ref = db.collection("users").document(user_id)
+    if user_ref.get(field_paths=["stories_count"]).exists:
+        batch.update(user_ref, {"stories_count": firestore.Increment(delta)})
+
+
+def _create_story_document(db, story_data: Dict[str, Any]) -> None:
+    """
+    Create a story and bump its owner's stories_count in one atomic write.
+    
+    Args:
+        db: Firestore client
+        story_data: Initial story document
+    """
+    batch = db.batch()
+    batch.set(db.collection("stories").document(story_data["id"]), story_data)
+    _add_stories_count_update(db, batch, story_data["user_id"], 1)
+    batch.commit()
+
+
+def _delete_blobs(bucket, blob_names: List[str]) -> None:
+    """
+    Delete storage blobs in a single batched request.
+    
+    Args:
+        bucket: Firebase Storage bucket
+        blob_names: Names of the blobs to delete
+    """
+    try:
+        with bucket.client.batch():
+            for blob_name in blob_names:
+                bucket.blob(blob_name).delete()
+    except NotFound:
+        # Already-missing blobs fail only their own part of the batch
+        pass
+
+
+def _delete_story_documents(db, story_ref, user_id: str) -> None:
+    """
+    Delete a story's reviews and then the story document itself.
+    
+    Deletes are committed up to FIRESTORE_BATCH_LIMIT per round-trip. The
+    last batch also decrements the owner's stories_count, so the counter
+    changes atomically with the story delete.
+    
+    Args:
+        db: Firestore client
+        story_ref: Reference to the story document
+        user_id: Owner of the story
+    """
+    reviews_ref = db.collection("reviews").where("story_id", "==", story_ref.id)
+    doc_refs = [review_doc.reference for review_doc in reviews_ref.stream()]
+    doc_refs.append(story_ref)
+    
+    # Leave room in the last batch for the counter update
+    last_batch_start = max(0, len(doc_refs) - (FIRESTORE_BATCH_LIMIT - 1))
+    for i in range(0, last_batch_start, FIRESTORE_BATCH_LIMIT):
+        batch = db.batch()
+        for doc_ref in doc_refs[i:min(i + FIRESTORE_BATCH_LIMIT, last_batch_start)]:
+            batch.delete(doc_ref)
+        batch.commit()
+    
+    batch = db.batch()
+    for doc_ref in doc_refs[last_batch_start:]:
+        batch.delete(doc_ref)
+    _add_stories_count_update(db, batch, user_id, -1)
+    batch.commit()
+
+
 async def _delete_storage_files(file_urls: List[str]) -> None:
     """
     Delete files from Firebase Storage.
@@ -134,50 +247,54 @@ async def _delete_storage_files(file_urls: List[str]) -> None:
     """
     try:
         bucket = get_bucket()
-        for url in file_urls:
-            if url:
-                # Extract blob name from URL
-                blob_name = url.split(f"{bucket.name}/")[-1].split("?")[0]
-                blob = bucket.blob(blob_name)
-                if blob.exists():
-                    blob.delete()
+        prefix = f"/{bucket.name}/"
+        blob_names = [
+            urlparse(url).path.split(prefix, 1)[-1]
+            for url in file_urls
+            if url
+        ]
+        if blob_names:
+            await asyncio.to_thread(_delete_blobs, bucket, blob_names)
     except Exception as e:
-        print(f"Warning: Failed to delete some storage files: {str(e)}")
+        logger.warning("Failed to delete some storage files: %s", e)
 
 
 async def _delete_cloudinary_files(cloudinary_ids: Dict[str, Any]) -> None:
     """
     Delete files from Cloudinary.
     
+    Images are removed in one bulk call; audio and video share Cloudinary's
+    "video" resource type and are removed together in a second one.
+    
     Args:
         cloudinary_ids: Dictionary containing Cloudinary public IDs
     """
-    try:
-        # Delete images
-        image_ids = cloudinary_ids.get("images", [])
-        for public_id in image_ids:
-            if public_id:
-                result = cloudinary_service.delete_file(public_id, resource_type="image")
-                if not result.get("success"):
-                    print(f"Warning: Failed to delete image {public_id}")
-        
-        # Delete audio
-        audio_id = cloudinary_ids.get("audio")
-        if audio_id:
-            result = cloudinary_service.delete_file(audio_id, resource_type="video")
-            if not result.get("success"):
-                print(f"Warning: Failed to delete audio {audio_id}")
-        
-        # Delete video
-        video_id = cloudinary_ids.get("video")
-        if video_id:
-            result = cloudinary_service.delete_file(video_id, resource_type="video")
-            if not result.get("success"):
-                print(f"Warning: Failed to delete video {video_id}")
-                
-    except Exception as e:
-        print(f"Warning: Failed to delete some Cloudinary files: {str(e)}")
-
+    image_ids = [public_id for public_id in cloudinary_ids.get("images", []) if public_id]
+    media_ids = [
+        public_id
+        for public_id in (cloudinary_ids.get("audio"), cloudinary_ids.get("video"))
+        if public_id
+    ]
+    
+    deletions = [
+        (public_ids, resource_type)
+        for public_ids, resource_type in ((image_ids, "image"), (media_ids, "video"))
+        if public_ids
+    ]
+    results = await asyncio.gather(
+        *(
+            asyncio.to_thread(cloudinary_service.delete_files, public_ids, resource_type=resource_type)
+            for public_ids, resource_type in deletions
+        ),
+        return_exceptions=True
+    )
+    
+    for (public_ids, resource_type), result in zip(deletions, results):
+        if isinstance(result, Exception):
+            logger.warning("Failed to delete some Cloudinary files: %s", result)
+        elif not result.get("success"):
+            logger.warning("Failed to delete Cloudinary %s files %s: %s",
+                           resource_type, public_ids, result.get('error') or result.get('deleted'))
 
 
 # ========== Story Generation Endpoints ==========
@@ -210,6 +327,7 @@ async def generate_story(
         story_id = str(uuid.uuid4())
         
         # Create initial story document
+        now = datetime.now(timezone.utc)
         story_data = {
             "id": story_id,
             "user_id": user_id,
@@ -218,12 +336,12 @@ async def generate_story(
             "image_urls": [],
             "video_url": None,
             "audio_url": None,
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow(),
+            "created_at": now,
+            "updated_at": now,
             "status": "processing"
         }
         
-        db.collection("stories").document(story_id).set(story_data)
+        await asyncio.to_thread(_create_story_document, db, story_data)
         
         # Process story generation in background
         background_tasks.add_task(
@@ -253,145 +371,178 @@ async def _process_story_generation(story_id: str, title: str, text_prompt: str)
     """
     Background task to process story generation workflow.
     
+    Waits for a free generation slot, then runs the pipeline.
+    
+    Args:
+        story_id: Story identifier
+        title: Story title
+        text_prompt: Story text content
+    """
+    async with _generation_slots:
+        await _generate_story_media(story_id, title, text_prompt)
+
+
+async def _generate_story_media(story_id: str, title: str, text_prompt: str):
+    """
+    Generate images, narration and video for a story and store the results.
+    
+    Blocking service and Firestore calls run in worker threads so the event
+    loop keeps serving requests while a story is being generated.
+    
     Args:
         story_id: Story identifier
         title: Story title
         text_prompt: Story text content
     """
     db = get_db()
-    temp_files = []
+    
+    # Every intermediate file is written here and removed with the directory
+    temp_dir = Path(f"temp_stories/{story_id}")
     
     try:
-        print(f"\n{'='*60}")
-        print(f"Processing story: {story_id}")
-        print(f"Title: {title}")
-        print(f"{'='*60}\n")
+        logger.info("Processing story %s: %s", story_id, title)
         
         # Step 1: Split text into scenes
         scenes = _split_text_into_scenes(text_prompt, max_scenes=5)
-        print(f"✓ Split into {len(scenes)} scenes")
+        logger.info("✓ [%s] Split into %d scenes", story_id, len(scenes))
         
         # Create temporary directory for processing
-        temp_dir = Path(f"temp_stories/{story_id}")
         temp_dir.mkdir(parents=True, exist_ok=True)
         
-        # Step 2: Generate images for each scene
-        print(f"\n🎨 Generating images...")
-        image_paths = []
-        image_prompts = []
-        
-        for idx, scene in enumerate(scenes, 1):
-            image_prompt = _generate_scene_image_prompt(scene, title)
-            image_prompts.append(image_prompt)
-            
-            image_path = str(temp_dir / f"scene_{idx}.png")
-            try:
-                result_path = image_service.generate_image(
-                    prompt=image_prompt,
-                    output_path=image_path
+        # Step 2: Start audio narration; it only needs the text, so it runs
+        # alongside image generation
+        logger.info("🎵 [%s] Generating audio narration...", story_id)
+        audio_path = str(temp_dir / "narration.mp3")
+        audio_task = asyncio.create_task(asyncio.to_thread(
+            audio_service.generate_audio,
+            text=text_prompt,
+            output_path=audio_path
+        ))
+        
+        # Step 3: Generate images for all scenes concurrently
+        logger.info("🎨 [%s] Generating images...", story_id)
+        semaphore = asyncio.Semaphore(IMAGE_GENERATION_CONCURRENCY)
+        scene_prompts = [_generate_scene_image_prompt(scene, title) for scene in scenes]
+        
+        # Scenes with identical prompts share one image, generated and
+        # uploaded once under the first such scene's file name
+        prompt_paths = {}
+        scene_paths = [
+            prompt_paths.setdefault(prompt, str(temp_dir / f"scene_{idx}.png"))
+            for idx, prompt in enumerate(scene_prompts, 1)
+        ]
+        
+        async def _generate_scene_image(prompt: str, output_path: str) -> str:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    image_service.generate_image,
+                    prompt=prompt,
+                    output_path=output_path
                 )
-                image_paths.append(result_path)
-                temp_files.append(result_path)
-            except Exception as e:
-                print(f"⚠ Failed to generate image {idx}: {str(e)}")
         
-        if not image_paths:
-            raise Exception("Failed to generate any images")
+        results = await asyncio.gather(
+            *map(_generate_scene_image, prompt_paths.keys(), prompt_paths.values()),
+            return_exceptions=True
+        )
         
-        # Step 3: Generate audio narration
-        print(f"\n🎵 Generating audio narration...")
-        audio_path = str(temp_dir / "narration.mp3")
+        generated = set()
+        for img_path, result in zip(prompt_paths.values(), results):
+            if isinstance(result, Exception):
+                logger.warning("⚠ [%s] Failed to generate image %s: %s", story_id, Path(img_path).stem, result)
+            else:
+                generated.add(img_path)
         
+        # Keep successful images in scene order for the video step
+        image_paths = [img_path for img_path in scene_paths if img_path in generated]
+        
+        # Wait for narration before the video step (or before bailing out,
+        # so the worker thread never writes into a removed temp directory)
         try:
-            audio_service.generate_audio(
-                text=text_prompt,
-                output_path=audio_path
-            )
-            temp_files.append(audio_path)
+            await audio_task
         except Exception as e:
-            print(f"⚠ Audio generation failed: {str(e)}")
+            logger.warning("⚠ [%s] Audio generation failed: %s", story_id, e)
             audio_path = None
         
+        if not image_paths:
+            raise Exception("Failed to generate any images")
+        
         # Step 4: Create video combining images and audio
         video_path = None
         if audio_path and image_paths:
-            print(f"\n🎬 Creating video...")
+            logger.info("🎬 [%s] Creating video...", story_id)
             video_path = str(temp_dir / "story_video.mp4")
             
             try:
-                video_service.create_video_from_images(
+                await asyncio.to_thread(
+                    video_service.create_video_from_images,
                     image_paths=image_paths,
                     audio_path=audio_path,
                     output_path=video_path,
                     add_transitions=True
                 )
-                temp_files.append(video_path)
             except Exception as e:
-                print(f"⚠ Video creation failed: {str(e)}")
+                logger.warning("⚠ [%s] Video creation failed: %s", story_id, e)
                 video_path = None
         
-        # Step 5: Upload files to Cloudinary
-        print(f"\n☁️ Uploading to Cloudinary...")
-        image_urls = []
-        cloudinary_public_ids = []
-        
-        for idx, img_path in enumerate(image_paths, 1):
-            try:
-                result = cloudinary_service.upload_image(
-                    file_path=img_path,
-                    folder=f"ai-story-generator/stories/{story_id}/images",
-                    public_id=f"scene_{idx}",
-                    tags=["story", story_id, "ai-generated"]
-                )
-                if result.get("success"):
-                    image_urls.append(result.get("url"))
-                    cloudinary_public_ids.append(result.get("public_id"))
-                    print(f"  ✓ Uploaded image {idx}")
-                else:
-                    print(f"⚠ Failed to upload image {idx}: {result.get('error')}")
-            except Exception as e:
-                print(f"⚠ Failed to upload image {idx}: {str(e)}")
-        
-        audio_url = None
-        audio_public_id = None
+        # Step 5: Upload files to Cloudinary (one concurrent batch)
+        logger.info("☁️ [%s] Uploading to Cloudinary...", story_id)
+        story_folder = f"ai-story-generator/stories/{story_id}"
+        unique_image_paths = list(dict.fromkeys(image_paths))
+        uploads = [
+            (img_path, "image", {
+                "folder": f"{story_folder}/images",
+                "public_id": Path(img_path).stem,
+                "tags": ["story", story_id, "ai-generated"]
+            })
+            for img_path in unique_image_paths
+        ]
         if audio_path:
-            try:
-                result = cloudinary_service.upload_audio(
-                    file_path=audio_path,
-                    folder=f"ai-story-generator/stories/{story_id}/audio",
-                    public_id="narration",
-                    tags=["story", story_id, "audio"]
-                )
-                if result.get("success"):
-                    audio_url = result.get("url")
-                    audio_public_id = result.get("public_id")
-                    print(f"  ✓ Uploaded audio")
-                else:
-                    print(f"⚠ Failed to upload audio: {result.get('error')}")
-            except Exception as e:
-                print(f"⚠ Failed to upload audio: {str(e)}")
-        
-        video_url = None
-        video_public_id = None
+            uploads.append((audio_path, "audio", {
+                "folder": f"{story_folder}/audio",
+                "public_id": "narration",
+                "tags": ["story", story_id, "audio"]
+            }))
         if video_path:
-            try:
-                result = cloudinary_service.upload_video(
-                    file_path=video_path,
-                    folder=f"ai-story-generator/stories/{story_id}/video",
-                    public_id="story_video",
-                    tags=["story", story_id, "video"]
-                )
-                if result.get("success"):
-                    video_url = result.get("url")
-                    video_public_id = result.get("public_id")
-                    print(f"  ✓ Uploaded video")
-                else:
-                    print(f"⚠ Failed to upload video: {result.get('error')}")
-            except Exception as e:
-                print(f"⚠ Failed to upload video: {str(e)}")
+            uploads.append((video_path, "video", {
+                "folder": f"{story_folder}/video",
+                "public_id": "story_video",
+                "tags": ["story", story_id, "video"]
+            }))
+        
+        upload_results = await asyncio.to_thread(cloudinary_service.upload_batch, uploads)
+        
+        uploaded = {}
+        for (file_path, kind, _), result in zip(uploads, upload_results):
+            label = f"image {Path(file_path).stem}" if kind == "image" else kind
+            if result.get("success"):
+                logger.info("  ✓ Uploaded %s", label)
+                uploaded[file_path] = result
+            else:
+                logger.warning("⚠ Failed to upload %s: %s", label, result.get('error'))
+        
+        uploaded_images = {
+            img_path: uploaded[img_path]
+            for img_path in unique_image_paths
+            if img_path in uploaded
+        }
+        audio_result = uploaded.get(audio_path)
+        video_result = uploaded.get(video_path)
+        
+        # One URL per scene (shared images repeat), one public ID per upload
+        image_urls = [
+            uploaded_images[img_path].get("url")
+            for img_path in image_paths
+            if img_path in uploaded_images
+        ]
+        cloudinary_public_ids = [result.get("public_id") for result in uploaded_images.values()]
+        
+        audio_url = audio_result.get("url") if audio_result else None
+        audio_public_id = audio_result.get("public_id") if audio_result else None
+        video_url = video_result.get("url") if video_result else None
+        video_public_id = video_result.get("public_id") if video_result else None
         
         # Step 6: Update Firestore with URLs and metadata
-        print(f"\n💾 Updating database...")
+        logger.info("💾 [%s] Updating database...", story_id)
         update_data = {
             "image_urls": image_urls,
             "audio_url": audio_url,
@@ -401,52 +552,41 @@ async def _process_story_generation(story_id: str, title: str, text_prompt: str)
                 "audio": audio_public_id,
                 "video": video_public_id
             },
-            "updated_at": datetime.utcnow(),
+            "updated_at": datetime.now(timezone.utc),
             "status": "completed"
         }
         
-        db.collection("stories").document(story_id).update(update_data)
+        await asyncio.to_thread(db.collection("stories").document(story_id).update, update_data)
         
-        print(f"\n✓ Story generation completed successfully!")
-        print(f"  - Images: {len(image_urls)}")
-        print(f"  - Audio: {'Yes' if audio_url else 'No'}")
-        print(f"  - Video: {'Yes' if video_url else 'No'}")
+        logger.info(
+            "✓ [%s] Story generation completed (images: %d, audio: %s, video: %s)",
+            story_id, len(image_urls), "yes" if audio_url else "no", "yes" if video_url else "no"
+        )
         
     except Exception as e:
-        print(f"\n✗ Story generation failed: {str(e)}")
+        logger.error("✗ [%s] Story generation failed: %s", story_id, e)
         
         # Update status to failed
         try:
-            db.collection("stories").document(story_id).update({
+            await asyncio.to_thread(db.collection("stories").document(story_id).update, {
                 "status": "failed",
                 "error": str(e),
-                "updated_at": datetime.utcnow()
+                "updated_at": datetime.now(timezone.utc)
             })
         except:
             pass
     
     finally:
-        # Cleanup temporary files
-        for temp_file in temp_files:
-            try:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-            except:
-                pass
-        
-        # Remove temp directory
-        try:
-            if temp_dir.exists():
-                import shutil
-                shutil.rmtree(temp_dir, ignore_errors=True)
-        except:
-            pass
+        # Remove the temp directory and every file generated in it, off the
+        # event loop (awaited, so a regeneration of this story can't race it)
+        await asyncio.to_thread(shutil.rmtree, temp_dir, ignore_errors=True)
 
 
 @router.get("/history", response_model=StoryListResponse)
 async def get_story_history(
     limit: int = 10,
     offset: int = 0,
+    start_after: Optional[str] = None,
     token_data: Dict[str, Any] = Depends(verify_token)
 ):
     """
@@ -457,6 +597,8 @@ async def get_story_history(
     Args:
         limit: Maximum number of stories to return (default: 10, max: 50)
         offset: Number of stories to skip (default: 0)
+        start_after: ID of the last story on the previous page; when given, the
+            page starts right after it and offset is ignored (optional)
         token_data: Decoded authentication token
         
     Returns:
@@ -480,21 +622,41 @@ async def get_story_history(
             )
         
         # Query stories for user
-        stories_ref = db.collection("stories").where("user_id", "==", user_id)
-        stories_ref = stories_ref.order_by("created_at", direction="DESCENDING")
-        
-        # Get all stories for count
-        all_stories = list(stories_ref.stream())
-        total = len(all_stories)
+        user_stories = db.collection("stories").where("user_id", "==", user_id)
+        
+        # Fetch only the requested page, and only the fields in the response
+        stories_ref = (
+            user_stories
+            .select(STORY_RESPONSE_FIELDS)
+            .order_by("created_at", direction="DESCENDING")
+            .limit(limit)
+        )
         
-        # Apply pagination
-        paginated_stories = all_stories[offset:offset + limit]
+        if start_after:
+            cursor_doc = await asyncio.to_thread(db.collection("stories").document(start_after).get)
+            if not cursor_doc.exists or cursor_doc.get("user_id") != user_id:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid start_after cursor"
+                )
+            stories_ref = stories_ref.start_after(cursor_doc)
+        elif offset:
+            stories_ref = stories_ref.offset(offset)
+        
+        # Count server-side instead of downloading every story, concurrently
+        # with the page fetch
+        count_result, paginated_stories = await asyncio.gather(
+            asyncio.to_thread(user_stories.count().get),
+            asyncio.to_thread(stories_ref.get)
+        )
+        total = count_result[0][0].value
         
-        # Convert to StoryResponse objects
+        # Convert to StoryResponse objects; these documents were written by
+        # this service, so field validation is skipped
         story_list = []
         for doc in paginated_stories:
             story_data = doc.to_dict()
-            story_list.append(StoryResponse(**story_data))
+            story_list.append(StoryResponse.model_construct(**story_data))
         
         return StoryListResponse(
             stories=story_list,
@@ -533,7 +695,7 @@ async def get_story(
         
         # Get story document
         story_ref = db.collection("stories").document(story_id)
-        story_doc = story_ref.get()
+        story_doc = await asyncio.to_thread(story_ref.get, field_paths=STORY_RESPONSE_FIELDS)
         
         if not story_doc.exists:
             raise HTTPException(
@@ -546,7 +708,7 @@ async def get_story(
         # Verify ownership
         _verify_story_ownership(story_data, user_id)
         
-        return StoryResponse(**story_data)
+        return StoryResponse.model_construct(**story_data)
         
     except HTTPException:
         raise
@@ -585,7 +747,7 @@ async def update_story(
         
         # Get existing story
         story_ref = db.collection("stories").document(story_id)
-        story_doc = story_ref.get()
+        story_doc = await asyncio.to_thread(story_ref.get, field_paths=STORY_RESPONSE_FIELDS)
         
         if not story_doc.exists:
             raise HTTPException(
@@ -599,7 +761,7 @@ async def update_story(
         _verify_story_ownership(story_data, user_id)
         
         # Prepare update data
-        update_data = {"updated_at": datetime.utcnow()}
+        update_data = {"updated_at": datetime.now(timezone.utc)}
         
         if story_update.title is not None:
             update_data["title"] = story_update.title
@@ -619,7 +781,7 @@ async def update_story(
                 background_tasks.add_task(_delete_storage_files, old_files)
             
             # Update story with processing status
-            story_ref.update(update_data)
+            await asyncio.to_thread(story_ref.update, update_data)
             
             # Regenerate media in background
             background_tasks.add_task(
@@ -632,10 +794,9 @@ async def update_story(
             return StoryResponse(**{**story_data, **update_data})
         
         # If only title updated, update immediately
-        story_ref.update(update_data)
-        updated_story = story_ref.get().to_dict()
+        await asyncio.to_thread(story_ref.update, update_data)
         
-        return StoryResponse(**updated_story)
+        return StoryResponse(**{**story_data, **update_data})
         
     except HTTPException:
         raise
@@ -670,9 +831,12 @@ async def delete_story(
         db = get_db()
         user_id = token_data['uid']
         
-        # Get story document
+        # Get the owner and media IDs; nothing else is needed to delete
         story_ref = db.collection("stories").document(story_id)
-        story_doc = story_ref.get()
+        story_doc = await asyncio.to_thread(
+            story_ref.get,
+            field_paths=["user_id", "cloudinary_ids"]
+        )
         
         if not story_doc.exists:
             raise HTTPException(
@@ -692,13 +856,7 @@ async def delete_story(
         if cloudinary_ids:
             background_tasks.add_task(_delete_cloudinary_files, cloudinary_ids)
         
-        # Delete reviews sub-collection
-        reviews_ref = db.collection("reviews").where("story_id", "==", story_id)
-        for review_doc in reviews_ref.stream():
-            review_doc.reference.delete()
-        
-        # Delete Firestore document
-        story_ref.delete()
+        await asyncio.to_thread(_delete_story_documents, db, story_ref, user_id)
         
         return SuccessResponse(
             message="Story deleted successfully",
@@ -744,9 +902,9 @@ async def submit_story_review(
                 detail="Story ID in request body doesn't match URL parameter"
             )
         
-        # Get story document
+        # Get the story's owner; only user_id is needed to authorize a review
         story_ref = db.collection("stories").document(story_id)
-        story_doc = story_ref.get()
+        story_doc = await asyncio.to_thread(story_ref.get, field_paths=["user_id"])
         
         if not story_doc.exists:
             raise HTTPException(
@@ -771,10 +929,10 @@ async def submit_story_review(
             "user_id": user_id,
             "rating": review.rating,
             "feedback": review.feedback,
-            "created_at": datetime.utcnow()
+            "created_at": datetime.now(timezone.utc)
         }
         
-        db.collection("reviews").document(review_id).set(review_data)
+        await asyncio.to_thread(db.collection("reviews").document(review_id).set, review_data)
         
         return SuccessResponse(
             message="Review submitted successfully",
@@ -5,11 +5,37 @@ Handles text-to-speech audio generation using gTTS (Google Text-to-Speech).
 """
 
 import os
+import logging
 import re
+import tempfile
 from gtts import gTTS
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 import math
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from app.utils.file_cache import cache_key, fetch_from_cache, store_in_cache
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of gTTS requests in flight in generate_multiple_audios
+MAX_PARALLEL_GENERATIONS = 8
+
+# Directory holding previously synthesized narrations, keyed by (lang, slow, text)
+TTS_CACHE_DIR = Path(os.getenv("TTS_CACHE_DIR", os.path.join(tempfile.gettempdir(), "gtts_cache")))
+
+# Least recently used narrations are evicted once the cache holds more files than this
+TTS_CACHE_MAX_FILES = int(os.getenv("TTS_CACHE_MAX_FILES", "500"))
+
+# Layer III bitrates (kbps) by header bitrate index, for MPEG-1 and for
+# MPEG-2/2.5 (gTTS returns MPEG-2 audio); index 0 is "free" and 15 is invalid
+_MP3_BITRATES_V1 = (None, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+_MP3_BITRATES_V2 = (None, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+
+# Bytes scanned after any ID3v2 tag when looking for the first frame header
+_MP3_HEADER_SCAN_BYTES = 4096
+
+# Sentence boundary: whitespace following terminal punctuation
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
 
 
 class AudioService:
@@ -20,13 +46,15 @@ class AudioService:
         self.supported_languages = ['en', 'es', 'fr', 'de', 'it', 'pt', 'ru', 'ja', 'ko', 'zh-CN']
         self.default_words_per_minute = 150  # Average speaking rate
         self.default_language = 'en'
+        self._cache_dir = TTS_CACHE_DIR
     
     def generate_audio(
         self, 
         text: str, 
         output_path: str, 
         lang: str = 'en',
-        slow: bool = False
+        slow: bool = False,
+        validate: bool = True
     ) -> str:
         """
         Generate audio narration from text using gTTS.
@@ -36,6 +64,9 @@ class AudioService:
             output_path: Local file path to save the audio (MP3 format)
             lang: Language code (default: 'en')
             slow: Whether to use slow speech rate (default: False)
+            validate: Whether to fully validate and report the saved file when
+                debug logging is enabled; otherwise only a missing or empty
+                file is rejected (default: True)
             
         Returns:
             str: Local file path where the audio was saved
@@ -61,25 +92,39 @@ class AudioService:
                 f"Supported languages: {', '.join(self.supported_languages)}"
             )
         
-        # Ensure output directory exists
-        output_dir = Path(output_path).parent
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
         # Ensure output path has .mp3 extension
+        path = Path(output_path)
         if not output_path.lower().endswith('.mp3'):
-            output_path = str(Path(output_path).with_suffix('.mp3'))
+            path = path.with_suffix('.mp3')
+            output_path = str(path)
+        
+        # Ensure output directory exists
+        path.parent.mkdir(parents=True, exist_ok=True)
         
         try:
-            # Create gTTS object
-            tts = gTTS(text=text.strip(), lang=lang, slow=slow)
-            
-            # Save audio to file
-            tts.save(output_path)
+            cache_file = self._cache_dir / f"{cache_key(lang, slow, text.strip())}.mp3"
             
-            # Validate the generated file
-            file_info = self.validate_audio_file(output_path)
+            # Reuse an earlier narration of the same text, if cached
+            if not fetch_from_cache(cache_file, output_path):
+                # Create gTTS object
+                tts = gTTS(text=text.strip(), lang=lang, slow=slow)
+                
+                # Save audio to file
+                tts.save(output_path)
+                store_in_cache(output_path, cache_file, TTS_CACHE_MAX_FILES)
             
-            print(f"✓ Audio generated: {output_path} ({file_info['size_kb']:.2f} KB, ~{file_info['estimated_duration']:.1f}s)")
+            # Validate the generated file; the full report (stat plus MP3
+            # header parse) only feeds a debug line, so skip it unless logged
+            if validate and logger.isEnabledFor(logging.DEBUG):
+                file_info = self.validate_audio_file(output_path)
+                
+                logger.debug(
+                    "✓ Audio generated: %s (%.2f KB, ~%.1fs)",
+                    output_path, file_info['size_kb'], file_info['estimated_duration']
+                )
+            elif not (os.path.exists(output_path) and os.path.getsize(output_path) > 0):
+                # Never pass on a missing or empty file
+                raise ValueError(f"Audio file is missing or empty: {output_path}")
             
             return output_path
             
@@ -119,14 +164,10 @@ class AudioService:
             raise ValueError("Words per minute must be positive")
         
         # Count words (split by whitespace)
-        words = text.strip().split()
-        word_count = len(words)
-        
-        # Calculate duration in seconds
-        duration_seconds = (word_count / words_per_minute) * 60
+        word_count = len(text.split())
         
-        # Add padding for punctuation pauses (approximately 10%)
-        duration_seconds *= 1.1
+        # Seconds per word, including ~10% padding for punctuation pauses
+        duration_seconds = word_count * (66.0 / words_per_minute)
         
         return round(duration_seconds, 2)
     
@@ -161,8 +202,7 @@ class AudioService:
         max_words = int((max_duration * words_per_minute) / 60)
         
         # Split text into sentences (using regex for better sentence detection)
-        sentence_pattern = r'(?<=[.!?])\s+'
-        sentences = re.split(sentence_pattern, text.strip())
+        sentences = _SENTENCE_SPLIT_RE.split(text.strip())
         
         chunks = []
         current_chunk = []
@@ -223,20 +263,21 @@ class AudioService:
             current_word_count = 0
             
             for part in comma_parts:
-                part_words = part.strip().split()
-                part_word_count = len(part_words)
+                # Strip and count each part once
+                part = part.strip()
+                part_word_count = len(part.split())
                 
                 if current_word_count + part_word_count > max_words:
                     if current_chunk:
-                        chunks.append(','.join(current_chunk).strip())
-                    current_chunk = [part.strip()]
+                        chunks.append(','.join(current_chunk))
+                    current_chunk = [part]
                     current_word_count = part_word_count
                 else:
-                    current_chunk.append(part.strip())
+                    current_chunk.append(part)
                     current_word_count += part_word_count
             
             if current_chunk:
-                chunks.append(','.join(current_chunk).strip())
+                chunks.append(','.join(current_chunk))
             
             return chunks
         
@@ -266,12 +307,13 @@ class AudioService:
         """
         path = Path(file_path)
         
-        # Check if file exists
-        if not path.exists():
+        # Check if file exists (a single stat also gives the size)
+        try:
+            file_size = path.stat().st_size
+        except FileNotFoundError:
             raise FileNotFoundError(f"Audio file not found: {file_path}")
         
         # Check if file is not empty
-        file_size = path.stat().st_size
         if file_size == 0:
             raise ValueError(f"Audio file is empty: {file_path}")
         
@@ -279,11 +321,17 @@ class AudioService:
         if not path.suffix.lower() == '.mp3':
             raise ValueError(f"Invalid audio format. Expected MP3, got: {path.suffix}")
         
-        # Read file to estimate duration (rough estimation based on file size)
-        # MP3 files are typically 1-2 MB per minute at standard quality
-        # Using 128 kbps as baseline: ~1 MB per minute
         size_mb = file_size / (1024 * 1024)
-        estimated_duration = size_mb * 60  # rough estimate
+        
+        # Estimate duration from the first frame's bitrate (exact for constant
+        # bitrate audio such as gTTS output)
+        header = self._parse_mp3_header(path)
+        if header:
+            bitrate_kbps, audio_offset = header
+            estimated_duration = (file_size - audio_offset) * 8 / (bitrate_kbps * 1000)
+        else:
+            # Fall back to a size-based guess: ~1 MB per minute at 128 kbps
+            estimated_duration = size_mb * 60
         
         return {
             "exists": True,
@@ -295,6 +343,48 @@ class AudioService:
             "estimated_duration": estimated_duration
         }
     
+    def _parse_mp3_header(self, path: Path) -> Optional[Tuple[int, int]]:
+        """
+        Read the bitrate from the first MPEG Layer III frame header.
+        
+        Args:
+            path: Path to the MP3 file
+            
+        Returns:
+            Tuple of (bitrate in kbps, byte offset of the audio data), or None
+            if no valid frame header is found
+        """
+        with path.open('rb') as f:
+            data = f.read(10)
+            audio_offset = 0
+            
+            # Skip an ID3v2 tag; its size is a 28-bit "syncsafe" integer
+            if len(data) == 10 and data[:3] == b'ID3':
+                audio_offset = 10 + (
+                    (data[6] & 0x7F) << 21 | (data[7] & 0x7F) << 14 | (data[8] & 0x7F) << 7 | (data[9] & 0x7F)
+                )
+                if data[5] & 0x10:  # Footer present
+                    audio_offset += 10
+                f.seek(audio_offset)
+                data = b''
+            
+            data += f.read(_MP3_HEADER_SCAN_BYTES)
+        
+        # Find the first 11-bit frame sync followed by a valid Layer III header
+        start = data.find(b'\xff')
+        while 0 <= start <= len(data) - 4:
+            b1, b2 = data[start + 1], data[start + 2]
+            version = (b1 >> 3) & 0x03  # 0 = MPEG-2.5, 2 = MPEG-2, 3 = MPEG-1
+            layer = (b1 >> 1) & 0x03  # 1 = Layer III
+            bitrate_index = b2 >> 4
+            if (b1 & 0xE0) == 0xE0 and version != 1 and layer == 1 \
+                    and 0 < bitrate_index < 15 and (b2 >> 2) & 0x03 != 3:
+                bitrates = _MP3_BITRATES_V1 if version == 3 else _MP3_BITRATES_V2
+                return bitrates[bitrate_index], audio_offset + start
+            start = data.find(b'\xff', start + 1)
+        
+        return None
+    
     def generate_multiple_audios(
         self,
         texts: List[str],
@@ -324,45 +414,48 @@ class AudioService:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
-        generated_paths = []
+        generated = {}
         failed_items = []
         
-        print(f"🎵 Generating {len(texts)} audio files...")
+        logger.info("🎵 Generating %d audio files...", len(texts))
         
-        for idx, text in enumerate(texts, start=1):
-            try:
-                # Generate sequential filename
-                filename = f"{prefix}_{idx:03d}.mp3"
-                file_path = output_path / filename
-                
-                print(f"  [{idx}/{len(texts)}] Generating audio: {text[:50]}...")
-                
-                # Generate the audio
-                result_path = self.generate_audio(
+        # gTTS requests are network-bound, so run them on a small thread pool
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_GENERATIONS, len(texts))) as executor:
+            futures = {
+                executor.submit(
+                    self.generate_audio,
                     text=text,
-                    output_path=str(file_path),
-                    lang=lang
-                )
-                
-                generated_paths.append(result_path)
-                
-            except Exception as e:
-                error_msg = f"Failed to generate audio {idx}: {str(e)}"
-                print(f"✗ {error_msg}")
-                failed_items.append({
-                    "index": idx,
-                    "text": text[:100],
-                    "error": str(e)
-                })
-                continue
+                    output_path=str(output_path / f"{prefix}_{idx:03d}.mp3"),  # Sequential filename
+                    lang=lang,
+                    validate=False  # Progress is reported per item below
+                ): (idx, text)
+                for idx, text in enumerate(texts, start=1)
+            }
+            
+            for future in as_completed(futures):
+                idx, text = futures[future]
+                try:
+                    generated[idx] = future.result()
+                    logger.debug("  [%d/%d] Generated audio: %.50s...", idx, len(texts), text)
+                except Exception as e:
+                    logger.warning("✗ Failed to generate audio %d: %s", idx, e)
+                    failed_items.append({
+                        "index": idx,
+                        "text": text[:100],
+                        "error": str(e)
+                    })
+        
+        # Return paths in input order regardless of completion order
+        generated_paths = [generated[idx] for idx in sorted(generated)]
+        failed_items.sort(key=lambda item: item["index"])
         
         # Report results
         if failed_items:
-            print(f"⚠ Generated {len(generated_paths)}/{len(texts)} audio files. {len(failed_items)} failed.")
+            logger.warning("⚠ Generated %d/%d audio files. %d failed.", len(generated_paths), len(texts), len(failed_items))
             if len(generated_paths) == 0:
                 raise Exception(f"All audio generations failed. First error: {failed_items[0]['error']}")
         else:
-            print(f"✓ Successfully generated all {len(texts)} audio files")
+            logger.info("✓ Successfully generated all %d audio files", len(texts))
         
         return generated_paths
 
@@ -5,13 +5,25 @@ Handles uploading generated images, audio, and video files to Cloudinary.
 """
 
 import os
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import cloudinary
 import cloudinary.uploader
+import cloudinary.api
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables (not needed in production)
+if os.getenv('ENVIRONMENT') != 'production':
+    load_dotenv()
+
+# Maximum number of concurrent uploads in upload_batch
+MAX_PARALLEL_UPLOADS = 8
+
+# Files larger than this are uploaded in chunks, each retried independently
+LARGE_UPLOAD_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+# Chunk size used for large uploads
+UPLOAD_CHUNK_SIZE_BYTES = 6_000_000
 
 
 class CloudinaryService:
@@ -39,6 +51,25 @@ class CloudinaryService:
         
         self.cloud_name = cloud_name
     
+    def _upload(self, file_path: str, **upload_options) -> Dict[str, Any]:
+        """
+        Upload a file in one request, or in chunks if it is large.
+        
+        Args:
+            file_path: Path to the local file
+            **upload_options: Cloudinary upload options
+        
+        Returns:
+            Cloudinary upload response
+        """
+        if os.path.getsize(file_path) > LARGE_UPLOAD_THRESHOLD_BYTES:
+            return cloudinary.uploader.upload_large(
+                file_path,
+                chunk_size=UPLOAD_CHUNK_SIZE_BYTES,
+                **upload_options
+            )
+        return cloudinary.uploader.upload(file_path, **upload_options)
+    
     def upload_image(
         self,
         file_path: str,
@@ -77,7 +108,7 @@ class CloudinaryService:
             if tags:
                 upload_options["tags"] = tags
             
-            result = cloudinary.uploader.upload(file_path, **upload_options)
+            result = self._upload(file_path, **upload_options)
             
             return {
                 "success": True,
@@ -128,7 +159,7 @@ class CloudinaryService:
             if tags:
                 upload_options["tags"] = tags
             
-            result = cloudinary.uploader.upload(file_path, **upload_options)
+            result = self._upload(file_path, **upload_options)
             
             return {
                 "success": True,
@@ -179,7 +210,7 @@ class CloudinaryService:
             if tags:
                 upload_options["tags"] = tags
             
-            result = cloudinary.uploader.upload(file_path, **upload_options)
+            result = self._upload(file_path, **upload_options)
             
             return {
                 "success": True,
@@ -199,6 +230,47 @@ class CloudinaryService:
                 "error": str(e)
             }
     
+    def upload_batch(
+        self,
+        items: List[Tuple[str, str, Dict[str, Any]]],
+        **options
+    ) -> List[Dict[str, Any]]:
+        """
+        Upload several files concurrently.
+        
+        Args:
+            items: (file_path, kind, file_options) triples, where kind is "image",
+                "audio" or "video" and file_options are upload options for that
+                file only (e.g. public_id)
+            **options: Upload options shared by every file (e.g. tags)
+        
+        Returns:
+            List of upload results, in the same order as items
+        
+        Raises:
+            ValueError: If an item has an unknown kind
+        """
+        upload_fns = {
+            "image": self.upload_image,
+            "audio": self.upload_audio,
+            "video": self.upload_video
+        }
+        
+        unknown_kinds = {kind for _, kind, _ in items if kind not in upload_fns}
+        if unknown_kinds:
+            raise ValueError(f"Unknown upload kind(s): {', '.join(sorted(unknown_kinds))}")
+        
+        if not items:
+            return []
+        
+        # Uploads are network-bound; the SDK's shared urllib3 pool keeps
+        # connections alive across these threads
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_UPLOADS, len(items))) as executor:
+            return list(executor.map(
+                lambda item: upload_fns[item[1]](item[0], **{**options, **item[2]}),
+                items
+            ))
+    
     def delete_file(self, public_id: str, resource_type: str = "image") -> Dict[str, Any]:
         """
         Delete a file from Cloudinary.
@@ -220,7 +292,39 @@ class CloudinaryService:
                 "success": result.get("result") == "ok",
                 "result": result.get("result")
             }
+        
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
+    def delete_files(self, public_ids: List[str], resource_type: str = "image") -> Dict[str, Any]:
+        """
+        Delete several files of the same resource type in one Admin API call.
+        
+        Args:
+            public_ids: Public IDs of the files to delete (at most 100)
+            resource_type: Type of resource ("image", "video", "raw")
+        
+        Returns:
+            Dictionary containing the per-ID deletion status
+        """
+        try:
+            result = cloudinary.api.delete_resources(
+                public_ids,
+                resource_type=resource_type
+            )
+            deleted = result.get("deleted", {})
             
+            return {
+                "success": all(
+                    deleted.get(public_id) in ("deleted", "not_found")
+                    for public_id in public_ids
+                ),
+                "deleted": deleted
+            }
+        
         except Exception as e:
             return {
                 "success": False,
@@ -5,15 +5,35 @@ Handles AI image generation using Together AI API with FLUX.1-schnell model.
 """
 
 import os
+import logging
 from typing import List, Optional
 import time
+import tempfile
 import requests
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from together import Together
 from dotenv import load_dotenv
+from app.utils.file_cache import cache_key, fetch_from_cache, store_in_cache
 
-# Load environment variables
-load_dotenv()
+# Load environment variables (not needed in production)
+if os.getenv('ENVIRONMENT') != 'production':
+    load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of images requested at once in generate_multiple_images
+# (kept low to stay clear of Together AI rate limits)
+MAX_PARALLEL_GENERATIONS = 5
+
+# Block size used when writing downloaded images to disk
+DOWNLOAD_CHUNK_BYTES = 1024 * 1024
+
+# Directory holding previously generated images, keyed by model, size, steps and prompt
+IMAGE_CACHE_DIR = Path(os.getenv("IMAGE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "together_img_cache")))
+
+# Least recently used images are evicted once the cache holds more files than this
+IMAGE_CACHE_MAX_FILES = int(os.getenv("IMAGE_CACHE_MAX_FILES", "500"))
 
 
 class TogetherImageService:
@@ -34,6 +54,10 @@ class TogetherImageService:
         self.default_height = 1024
         self.default_steps = 4  # Optimal for schnell model
         self.max_retries = 3
+        
+        # Reuse connections to the image CDN across downloads
+        self._session = requests.Session()
+        self._cache_dir = IMAGE_CACHE_DIR
     
     def generate_image(
         self, 
@@ -70,6 +94,12 @@ class TogetherImageService:
         output_dir = Path(output_path).parent
         output_dir.mkdir(parents=True, exist_ok=True)
         
+        # Reuse an earlier image for the same prompt and settings, if cached
+        cache_file = self._cache_dir / f"{cache_key(self.model, width, height, steps, prompt.strip())}.png"
+        if fetch_from_cache(cache_file, output_path):
+            logger.debug("✓ Image reused from cache: %s", output_path)
+            return output_path
+        
         # Retry logic with exponential backoff
         for attempt in range(self.max_retries):
             try:
@@ -91,8 +121,9 @@ class TogetherImageService:
                 
                 # Download and save the image
                 self._download_image(image_url, output_path)
+                store_in_cache(output_path, cache_file, IMAGE_CACHE_MAX_FILES)
                 
-                print(f"✓ Image generated successfully: {output_path}")
+                logger.debug("✓ Image generated successfully: %s", output_path)
                 return output_path
                 
             except Exception as e:
@@ -102,7 +133,7 @@ class TogetherImageService:
                 if "rate limit" in error_message.lower():
                     if attempt < self.max_retries - 1:
                         wait_time = (2 ** attempt) * 2  # Exponential backoff: 2, 4, 8 seconds
-                        print(f"⚠ Rate limit hit. Retrying in {wait_time}s... (attempt {attempt + 1}/{self.max_retries})")
+                        logger.warning("⚠ Rate limit hit. Retrying in %ss... (attempt %d/%d)", wait_time, attempt + 1, self.max_retries)
                         time.sleep(wait_time)
                         continue
                     else:
@@ -114,7 +145,7 @@ class TogetherImageService:
                 # For other errors, retry with backoff
                 if attempt < self.max_retries - 1:
                     wait_time = (2 ** attempt)  # Exponential backoff: 1, 2, 4 seconds
-                    print(f"⚠ Error occurred. Retrying in {wait_time}s... (attempt {attempt + 1}/{self.max_retries})")
+                    logger.warning("⚠ Error occurred. Retrying in %ss... (attempt %d/%d)", wait_time, attempt + 1, self.max_retries)
                     time.sleep(wait_time)
                 else:
                     raise Exception(f"Image generation failed after {self.max_retries} attempts: {error_message}")
@@ -153,48 +184,51 @@ class TogetherImageService:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
-        generated_paths = []
+        generated = {}
         failed_prompts = []
         
-        print(f"🎨 Generating {len(prompts)} images...")
+        logger.info("🎨 Generating %d images...", len(prompts))
         
-        for idx, prompt in enumerate(prompts, start=1):
-            try:
-                # Generate sequential filename (image_001.png, image_002.png, etc.)
-                filename = f"image_{idx:03d}.png"
-                file_path = output_path / filename
-                
-                print(f"  [{idx}/{len(prompts)}] Generating: {prompt[:50]}...")
-                
-                # Generate the image
-                result_path = self.generate_image(
+        # Each image is a network round-trip to Together AI, so run them on a small thread pool
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_GENERATIONS, len(prompts))) as executor:
+            futures = {
+                executor.submit(
+                    self.generate_image,
                     prompt=prompt,
-                    output_path=str(file_path),
+                    # Sequential filename (image_001.png, image_002.png, etc.)
+                    output_path=str(output_path / f"image_{idx:03d}.png"),
                     width=width,
                     height=height,
                     steps=steps
-                )
-                
-                generated_paths.append(result_path)
-                
-            except Exception as e:
-                error_msg = f"Failed to generate image {idx}: {str(e)}"
-                print(f"✗ {error_msg}")
-                failed_prompts.append({
-                    "index": idx,
-                    "prompt": prompt,
-                    "error": str(e)
-                })
-                # Continue with next image instead of failing completely
-                continue
+                ): (idx, prompt)
+                for idx, prompt in enumerate(prompts, start=1)
+            }
+            
+            for future in as_completed(futures):
+                idx, prompt = futures[future]
+                try:
+                    generated[idx] = future.result()
+                    logger.debug("  [%d/%d] Generated: %.50s...", idx, len(prompts), prompt)
+                except Exception as e:
+                    logger.warning("✗ Failed to generate image %d: %s", idx, e)
+                    # Keep the other images instead of failing completely
+                    failed_prompts.append({
+                        "index": idx,
+                        "prompt": prompt,
+                        "error": str(e)
+                    })
+        
+        # Return paths in prompt order regardless of completion order
+        generated_paths = [generated[idx] for idx in sorted(generated)]
+        failed_prompts.sort(key=lambda item: item["index"])
         
         # Report results
         if failed_prompts:
-            print(f"⚠ Generated {len(generated_paths)}/{len(prompts)} images. {len(failed_prompts)} failed.")
+            logger.warning("⚠ Generated %d/%d images. %d failed.", len(generated_paths), len(prompts), len(failed_prompts))
             if len(generated_paths) == 0:
                 raise Exception(f"All image generations failed. First error: {failed_prompts[0]['error']}")
         else:
-            print(f"✓ Successfully generated all {len(prompts)} images")
+            logger.info("✓ Successfully generated all %d images", len(prompts))
         
         return generated_paths
     
@@ -210,14 +244,19 @@ class TogetherImageService:
             Exception: If download fails
         """
         try:
-            response = requests.get(url, timeout=30, stream=True)
-            response.raise_for_status()
-            
-            # Save image to file
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            with self._session.get(url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                
+                # Save image to file in 1 MB blocks; iter_content decodes the body
+                # and raises requests exceptions for read timeouts and broken streams
+                try:
+                    with open(output_path, 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_BYTES):
+                            f.write(chunk)
+                except Exception:
+                    # Don't leave a truncated image behind
+                    Path(output_path).unlink(missing_ok=True)
+                    raise
             
         except requests.exceptions.Timeout:
             raise Exception("Image download timed out after 30 seconds")
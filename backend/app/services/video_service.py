@@ -5,6 +5,7 @@ Handles video creation by combining images and audio using FFmpeg.
 """
 
 import os
+import logging
 import ffmpeg
 import shutil
 import tempfile
@@ -13,6 +14,8 @@ from typing import List, Dict, Optional
 import subprocess
 import json
 
+logger = logging.getLogger(__name__)
+
 
 class VideoService:
     """Service for compiling images and audio into video using FFmpeg."""
@@ -21,7 +24,6 @@ class VideoService:
         """Initialize video service. FFmpeg verification is done lazily when needed."""
         self.default_resolution = (1920, 1080)
         self.default_fps = 30
-        self.temp_files = []  # Track temporary files for cleanup
         self.ffmpeg_verified = False  # Track if FFmpeg has been verified
     
     def _verify_ffmpeg_installed(self) -> None:
@@ -43,7 +45,7 @@ class VideoService:
                 timeout=5
             )
             if result.returncode == 0:
-                print("✓ FFmpeg is installed and accessible")
+                logger.info("✓ FFmpeg is installed and accessible")
                 self.ffmpeg_verified = True
             else:
                 raise RuntimeError("FFmpeg command failed")
@@ -97,6 +99,9 @@ class VideoService:
         output_dir = Path(output_path).parent
         output_dir.mkdir(parents=True, exist_ok=True)
         
+        # Temporary files of this call only; the service is shared by concurrent pipelines
+        temp_files = []
+        
         try:
             # Get audio duration
             audio_duration = self._get_media_duration(audio_path)
@@ -104,9 +109,9 @@ class VideoService:
             # Calculate duration per image
             duration_per_image = audio_duration / len(image_paths)
             
-            print(f"🎬 Creating video from {len(image_paths)} images...")
-            print(f"   Audio duration: {audio_duration:.2f}s")
-            print(f"   Duration per image: {duration_per_image:.2f}s")
+            logger.info("🎬 Creating video from %d images...", len(image_paths))
+            logger.debug("   Audio duration: %.2fs", audio_duration)
+            logger.debug("   Duration per image: %.2fs", duration_per_image)
             
             # Create temporary video path
             temp_video_path = output_path.replace('.mp4', '_temp_video.mp4')
@@ -117,7 +122,8 @@ class VideoService:
                     image_paths,
                     duration_per_image,
                     resolution,
-                    temp_video_path
+                    temp_video_path,
+                    temp_files
                 )
             else:
                 # Create simple slideshow
@@ -138,14 +144,16 @@ class VideoService:
             # Clean up temporary video
             if video_path != final_path and os.path.exists(video_path):
                 os.remove(video_path)
-                print(f"   ✓ Cleaned up temporary video file")
+                logger.debug("   ✓ Cleaned up temporary video file")
             
-            print(f"✓ Video created successfully: {final_path}")
+            logger.info("✓ Video created successfully: %s", final_path)
             return final_path
             
         except Exception as e:
-            self._cleanup_temp_files()
             raise Exception(f"Video creation failed: {str(e)}")
+        finally:
+            # Intermediate clips are no longer needed once the final video exists
+            self._cleanup_temp_files(temp_files)
     
     def add_audio_to_video(
         self,
@@ -178,7 +186,7 @@ class VideoService:
         output_dir.mkdir(parents=True, exist_ok=True)
         
         try:
-            print(f"🎵 Adding audio to video...")
+            logger.debug("🎵 Adding audio to video...")
             
             # Get video and audio inputs
             video_input = ffmpeg.input(video_path)
@@ -189,8 +197,8 @@ class VideoService:
                 video_duration = self._get_media_duration(video_path)
                 audio_duration = self._get_media_duration(audio_path)
                 
-                print(f"   Video duration: {video_duration:.2f}s")
-                print(f"   Audio duration: {audio_duration:.2f}s")
+                logger.debug("   Video duration: %.2fs", video_duration)
+                logger.debug("   Audio duration: %.2fs", audio_duration)
                 
                 # Adjust video speed if durations don't match
                 if abs(video_duration - audio_duration) > 0.5:  # More than 0.5s difference
@@ -212,7 +220,7 @@ class VideoService:
             # Run FFmpeg command
             output.run(overwrite_output=True, quiet=True)
             
-            print(f"✓ Audio added successfully")
+            logger.debug("✓ Audio added successfully")
             return output_path
             
         except ffmpeg.Error as e:
@@ -263,15 +271,17 @@ class VideoService:
         output_dir = Path(output_path).parent
         output_dir.mkdir(parents=True, exist_ok=True)
         
+        temp_files = []
+        
         try:
-            print(f"🎞️ Creating slideshow from {len(image_paths)} images...")
+            logger.info("🎞️ Creating slideshow from %d images...", len(image_paths))
             
             # Create a temporary file list for concat demuxer
             filelist_path = self._create_image_filelist(
                 image_paths,
                 duration_per_image
             )
-            self.temp_files.append(filelist_path)
+            temp_files.append(filelist_path)
             
             # Build FFmpeg command
             input_stream = ffmpeg.input(filelist_path, format='concat', safe=0)
@@ -299,7 +309,7 @@ class VideoService:
             # Run FFmpeg
             output.run(overwrite_output=True, quiet=True)
             
-            print(f"✓ Slideshow created successfully")
+            logger.info("✓ Slideshow created successfully")
             return output_path
             
         except ffmpeg.Error as e:
@@ -308,14 +318,15 @@ class VideoService:
         except Exception as e:
             raise Exception(f"Failed to create slideshow: {str(e)}")
         finally:
-            self._cleanup_temp_files()
+            self._cleanup_temp_files(temp_files)
     
     def _create_video_with_transitions(
         self,
         image_paths: List[str],
         duration_per_image: float,
         resolution: tuple,
-        output_path: str
+        output_path: str,
+        temp_files: List[str]
     ) -> str:
         """
         Create video with crossfade transitions between images.
@@ -325,6 +336,7 @@ class VideoService:
             duration_per_image: Duration for each image
             resolution: Target resolution
             output_path: Output video path
+            temp_files: List the intermediate clip paths are added to, for cleanup
             
         Returns:
             str: Path to created video
@@ -338,7 +350,7 @@ class VideoService:
             for i, img_path in enumerate(image_paths):
                 # Create a clip for each image
                 clip_output = output_path.replace('.mp4', f'_clip_{i}.mp4')
-                self.temp_files.append(clip_output)
+                temp_files.append(clip_output)
                 
                 input_stream = ffmpeg.input(img_path, loop=1, t=duration_per_image, framerate=self.default_fps)
                 stream = input_stream.filter('scale', resolution[0], resolution[1], force_original_aspect_ratio='decrease')
@@ -373,7 +385,7 @@ class VideoService:
             
         except Exception as e:
             # Fall back to simple slideshow if transitions fail
-            print(f"⚠ Transitions failed, falling back to simple slideshow: {str(e)}")
+            logger.warning("⚠ Transitions failed, falling back to simple slideshow: %s", e)
             return self.create_slideshow(image_paths, duration_per_image, output_path, resolution, add_fade=True)
     
     def _create_image_filelist(self, image_paths: List[str], duration: float) -> str:
@@ -442,16 +454,21 @@ class VideoService:
             if os.path.getsize(file_path) == 0:
                 raise ValueError(f"File is empty: {file_path}")
     
-    def _cleanup_temp_files(self) -> None:
-        """Clean up temporary files created during processing."""
-        for temp_file in self.temp_files:
+    def _cleanup_temp_files(self, temp_files: List[str]) -> None:
+        """
+        Clean up temporary files created during processing.
+        
+        Args:
+            temp_files: Paths of the temporary files to delete
+        """
+        for temp_file in temp_files:
             try:
                 if os.path.exists(temp_file):
                     os.remove(temp_file)
             except Exception as e:
-                print(f"⚠ Failed to delete temporary file {temp_file}: {str(e)}")
+                logger.warning("⚠ Failed to delete temporary file %s: %s", temp_file, e)
         
-        self.temp_files.clear()
+        temp_files.clear()
     
     def get_video_info(self, video_path: str) -> Dict:
         """
@@ -0,0 +1,82 @@
+"""
+File Cache Helpers
+
+Content-addressed on-disk caches for generated media (narrations, images).
+Entries are plain files named after a hash of the generation inputs; the
+least recently used entries are evicted once a cache grows past its limit.
+"""
+
+import os
+import uuid
+import shutil
+import hashlib
+from pathlib import Path
+
+
+def cache_key(*parts) -> str:
+    """
+    Build a cache key from the inputs that determine a generated file.
+    
+    Args:
+        *parts: Generation inputs (model, text, options, ...)
+    
+    Returns:
+        str: Hex SHA-256 digest of the inputs
+    """
+    return hashlib.sha256("|".join(map(str, parts)).encode()).hexdigest()
+
+
+def fetch_from_cache(cache_file: Path, output_path: str) -> bool:
+    """
+    Copy a cached file to output_path if it exists.
+    
+    Args:
+        cache_file: Cache entry to look up
+        output_path: Destination path
+    
+    Returns:
+        bool: True on a cache hit, False otherwise
+    """
+    try:
+        shutil.copyfile(cache_file, output_path)
+    except FileNotFoundError:
+        return False
+    
+    try:
+        os.utime(cache_file)  # Mark as recently used
+    except OSError:
+        pass
+    return True
+
+
+def store_in_cache(file_path: str, cache_file: Path, max_files: int) -> None:
+    """
+    Copy a freshly generated file into its cache and evict the least
+    recently used entries beyond max_files.
+    
+    Caching is best-effort: filesystem errors are ignored.
+    
+    Args:
+        file_path: Path of the generated file
+        cache_file: Cache entry to create
+        max_files: Maximum number of entries kept in the cache directory
+    """
+    cache_dir = cache_file.parent
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Copy under a unique name and rename, so readers never see a partial file
+        tmp_file = cache_dir / f"{cache_file.stem}.{uuid.uuid4().hex}.tmp"
+        shutil.copyfile(file_path, tmp_file)
+        os.replace(tmp_file, cache_file)
+        
+        entries = [entry for entry in os.scandir(cache_dir) if entry.name.endswith(cache_file.suffix)]
+        if len(entries) > max_files:
+            entries.sort(key=lambda entry: entry.stat().st_mtime)
+            for entry in entries[:len(entries) - max_files]:
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass  # Evicted concurrently by another thread
+    except OSError:
+        pass
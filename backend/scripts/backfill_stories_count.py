@@ -0,0 +1,48 @@
+"""
+Stories Count Backfill Script
+
+One-off utility to populate the denormalized `stories_count` field on user
+documents. Run this once after deploying the counter so users who created
+stories before it existed show correct counts in the admin user listing.
+"""
+
+import os
+import sys
+from collections import Counter
+from dotenv import load_dotenv
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config.firebase_config import initialize_firebase, get_db
+
+
+def backfill_stories_count():
+    """Recount every user's stories and write the totals to their user document."""
+    try:
+        # Initialize Firebase
+        initialize_firebase()
+        db = get_db()
+
+        # Tally stories per owner, fetching only the user_id field
+        counts = Counter(
+            story_doc.get("user_id")
+            for story_doc in db.collection("stories").select(["user_id"]).stream()
+        )
+
+        updated = 0
+        for user_doc in db.collection("users").stream():
+            user_doc.reference.update({"stories_count": counts.get(user_doc.id, 0)})
+            updated += 1
+
+        print(f"✓ Updated stories_count for {updated} users")
+        return updated
+
+    except Exception as e:
+        print(f"✗ Error backfilling stories_count: {str(e)}")
+        return 0
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    backfill_stories_count()
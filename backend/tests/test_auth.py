@@ -40,6 +40,15 @@ class TestUserRegistration:
         
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
     
+    def test_register_email_normalized(self):
+        """Test that differently-cased spellings of an email validate to one address"""
+        from app.models.schemas import UserRegister
+        
+        user = UserRegister(name="John Doe", email="  John.Doe@Example.COM ")
+        
+        assert user.email == "john.doe@example.com"
+        assert user.email == UserRegister(name="John Doe", email="john.doe@example.com").email
+    
     def test_register_user_weak_password(self, client):
         """Test registration with weak password"""
         user_data = {
@@ -187,6 +196,65 @@ class TestTokenVerification:
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
+class TestTokenCache:
+    """Test caching of verified Firebase ID tokens"""
+    
+    def _verify(self, auth, token, now):
+        """Run verify_id_token_cached with the module clock fixed at now"""
+        import asyncio
+        from app.routes.auth import verify_id_token_cached
+        
+        with patch('app.routes.auth.time') as mock_time:
+            mock_time.time.return_value = now
+            return asyncio.run(verify_id_token_cached(auth, token))
+    
+    def setup_method(self):
+        from app.routes.auth import _token_cache
+        _token_cache.clear()
+    
+    def test_cached_until_token_expiry(self):
+        """Test that a cache entry is reused only until the token's own exp"""
+        now = 1_700_000_000
+        mock_auth = MagicMock()
+        mock_auth.verify_id_token.return_value = {"uid": "test_user_123", "exp": now + 30}
+        
+        self._verify(mock_auth, "token-a", now)
+        self._verify(mock_auth, "token-a", now + 29)
+        assert mock_auth.verify_id_token.call_count == 1
+        
+        # Past exp but within the cache TTL: verified again
+        self._verify(mock_auth, "token-a", now + 31)
+        assert mock_auth.verify_id_token.call_count == 2
+    
+    def test_cache_ttl_caps_long_lived_tokens(self):
+        """Test that entries expire after the cache TTL even if the token lives longer"""
+        from app.routes.auth import TOKEN_CACHE_TTL_SECONDS
+        
+        now = 1_700_000_000
+        mock_auth = MagicMock()
+        mock_auth.verify_id_token.return_value = {"uid": "test_user_123", "exp": now + 3600}
+        
+        self._verify(mock_auth, "token-b", now)
+        self._verify(mock_auth, "token-b", now + TOKEN_CACHE_TTL_SECONDS + 1)
+        
+        assert mock_auth.verify_id_token.call_count == 2
+    
+    def test_tokens_without_valid_exp_not_cached(self):
+        """Test that tokens without exp, or already past it, are never cached"""
+        now = 1_700_000_000
+        mock_auth = MagicMock()
+        
+        mock_auth.verify_id_token.return_value = {"uid": "test_user_123"}
+        self._verify(mock_auth, "token-c", now)
+        self._verify(mock_auth, "token-c", now)
+        
+        mock_auth.verify_id_token.return_value = {"uid": "test_user_123", "exp": now}
+        self._verify(mock_auth, "token-d", now)
+        self._verify(mock_auth, "token-d", now)
+        
+        assert mock_auth.verify_id_token.call_count == 4
+
+
 class TestAdminRole:
     """Test admin role checks"""
     
@@ -244,6 +312,64 @@ class TestAdminRole:
             assert response.status_code in [status.HTTP_403_FORBIDDEN, status.HTTP_401_UNAUTHORIZED]
 
 
+class TestAdminLogWriter:
+    """Test the background writer for admin audit logs"""
+    
+    def test_queued_logs_written_in_one_batch(self):
+        """Test that logs queued within the flush window share one write"""
+        import asyncio
+        from app.routes import admin
+        
+        written = []
+        
+        async def scenario():
+            writer = asyncio.create_task(admin.run_admin_log_writer())
+            await asyncio.sleep(0)  # Let the writer create its queue
+            
+            for i in range(3):
+                admin._log_admin_action(admin_id="admin_user_123", action="warn_user", reason=f"reason {i}")
+            
+            await asyncio.sleep(admin.ADMIN_LOG_FLUSH_SECONDS * 3)
+            writer.cancel()
+            await asyncio.gather(writer, return_exceptions=True)
+        
+        with patch('app.routes.admin._write_admin_logs', side_effect=lambda entries: written.append(list(entries))):
+            asyncio.run(scenario())
+        
+        assert len(written) == 1
+        assert [entry["reason"] for entry in written[0]] == ["reason 0", "reason 1", "reason 2"]
+    
+    def test_pending_logs_flushed_on_cancel(self):
+        """Test that logs still waiting for the flush deadline are written at shutdown"""
+        import asyncio
+        from app.routes import admin
+        
+        written = []
+        
+        async def scenario():
+            writer = asyncio.create_task(admin.run_admin_log_writer())
+            await asyncio.sleep(0)
+            
+            admin._log_admin_action(admin_id="admin_user_123", action="ban_user")
+            admin._log_admin_action(admin_id="admin_user_123", action="unban_user")
+            await asyncio.sleep(0)  # Writer picks up the first entry and waits for more
+            
+            writer.cancel()
+            await asyncio.gather(writer, return_exceptions=True)
+        
+        with patch('app.routes.admin._write_admin_logs', side_effect=lambda entries: written.append(list(entries))), \
+             patch('app.routes.admin.ADMIN_LOG_FLUSH_SECONDS', 60):
+            asyncio.run(scenario())
+            
+            # Once the writer has stopped, logs are written directly
+            admin._log_admin_action(admin_id="admin_user_123", action="warn_user")
+        
+        assert [[entry["action"] for entry in entries] for entries in written] == [
+            ["ban_user", "unban_user"],
+            ["warn_user"]
+        ]
+
+
 class TestGetCurrentUser:
     """Test get current user endpoint"""
     
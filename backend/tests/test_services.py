@@ -142,6 +142,66 @@ class TestAudioService:
             
             with pytest.raises(IOError):
                 audio_service.generate_audio(text, output_path)
+    
+    def test_generate_audio_reuses_cached_narration(self, tmp_path):
+        """Test that narrating the same text twice calls gTTS only once"""
+        from app.services.audio_service import audio_service
+        
+        text = "Once upon a time in a magical kingdom"
+        first_path = str(tmp_path / "first.mp3")
+        second_path = str(tmp_path / "second.mp3")
+        
+        with patch('app.services.audio_service.gTTS') as mock_gtts, \
+             patch.object(audio_service, '_cache_dir', tmp_path / "tts_cache"):
+            mock_tts = MagicMock()
+            mock_tts.save.side_effect = lambda path: open(path, 'wb').write(b'\xff\xf3\x44\xc4' + b'\x00' * 996)
+            mock_gtts.return_value = mock_tts
+            
+            audio_service.generate_audio(text, first_path)
+            audio_service.generate_audio(f"  {text} ", second_path)
+            audio_service.generate_audio(text, str(tmp_path / "slow.mp3"), slow=True)
+        
+        # The padded text shares the first narration; slow speech is a separate entry
+        assert mock_gtts.call_count == 2
+        with open(first_path, 'rb') as first, open(second_path, 'rb') as second:
+            assert first.read() == second.read()
+    
+    def test_parse_mp3_header_mpeg2(self, tmp_path):
+        """Test reading the bitrate of an MPEG-2 Layer III frame (gTTS output)"""
+        from app.services.audio_service import audio_service
+        
+        # Sync + MPEG-2 Layer III, bitrate index 4 (32 kbps), 24 kHz
+        audio_path = tmp_path / "narration.mp3"
+        audio_path.write_bytes(b'\xff\xf3\x44\xc4' + b'\x00' * 3996)
+        
+        assert audio_service._parse_mp3_header(audio_path) == (32, 0)
+        
+        info = audio_service.validate_audio_file(str(audio_path))
+        assert info["estimated_duration"] == pytest.approx(4000 * 8 / 32000)
+    
+    def test_parse_mp3_header_skips_id3_tag(self, tmp_path):
+        """Test that frame-like bytes inside an ID3v2 tag are skipped"""
+        from app.services.audio_service import audio_service
+        
+        # 257-byte tag (syncsafe size 0x00 0x00 0x02 0x01) holding fake MPEG-2 headers
+        tag = b'ID3\x04\x00\x00\x00\x00\x02\x01' + b'\xff\xf3\x44\xc4' * 64 + b'\x00'
+        # A false sync (0xff followed by a non-sync byte), then an MPEG-1 128 kbps frame
+        audio_path = tmp_path / "tagged.mp3"
+        audio_path.write_bytes(tag + b'\xff\x00\x12' + b'\xff\xfb\x90\x64' + b'\x00' * 1000)
+        
+        assert audio_service._parse_mp3_header(audio_path) == (128, len(tag) + 3)
+    
+    def test_parse_mp3_header_no_frame(self, tmp_path):
+        """Test the size-based duration fallback when no frame header is found"""
+        from app.services.audio_service import audio_service
+        
+        audio_path = tmp_path / "silence.mp3"
+        audio_path.write_bytes(b'\x00' * 2048)
+        
+        assert audio_service._parse_mp3_header(audio_path) is None
+        
+        info = audio_service.validate_audio_file(str(audio_path))
+        assert info["estimated_duration"] == pytest.approx(2048 / (1024 * 1024) * 60)
 
 
 class TestVideoService:
@@ -239,6 +299,52 @@ class TestVideoService:
                 video_service.create_video(image_paths, None, output_path)
 
 
+class TestFileCache:
+    """Test the on-disk cache shared by the narration and image services"""
+    
+    def test_cache_hit_copies_entry(self, tmp_path):
+        """Test that a cached entry is copied to the output path"""
+        from app.utils.file_cache import cache_key, fetch_from_cache, store_in_cache
+        
+        generated = tmp_path / "generated.png"
+        generated.write_bytes(b"image")
+        cache_file = tmp_path / "cache" / f"{cache_key('model', 1024, 'prompt')}.png"
+        
+        assert not fetch_from_cache(cache_file, str(tmp_path / "miss.png"))
+        
+        store_in_cache(str(generated), cache_file, max_files=10)
+        output_path = tmp_path / "hit.png"
+        
+        assert fetch_from_cache(cache_file, str(output_path))
+        assert output_path.read_bytes() == b"image"
+    
+    def test_eviction_removes_least_recently_used(self, tmp_path):
+        """Test that eviction follows last use, not write order"""
+        from app.utils.file_cache import cache_key, fetch_from_cache, store_in_cache
+        
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        first_entry = cache_dir / f"{cache_key('first')}.png"
+        second_entry = cache_dir / f"{cache_key('second')}.png"
+        first_entry.write_bytes(b"first")
+        second_entry.write_bytes(b"second")
+        os.utime(first_entry, (1000, 1000))
+        os.utime(second_entry, (2000, 2000))
+        
+        # Reading the first entry makes the second the least recently used
+        assert fetch_from_cache(first_entry, str(tmp_path / "hit.png"))
+        
+        generated = tmp_path / "generated.png"
+        generated.write_bytes(b"third")
+        third_entry = cache_dir / f"{cache_key('third')}.png"
+        store_in_cache(str(generated), third_entry, max_files=2)
+        
+        assert third_entry.read_bytes() == b"third"
+        assert first_entry.exists()
+        assert not second_entry.exists()
+        assert len(list(cache_dir.iterdir())) == 2  # No temporary files left behind
+
+
 class TestServiceIntegration:
     """Test integration between services"""
     
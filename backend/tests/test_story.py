@@ -332,5 +332,50 @@ class TestOwnershipValidation:
             assert response.status_code == status.HTTP_403_FORBIDDEN
 
 
+class TestSceneSplitting:
+    """Test splitting story text into scenes"""
+    
+    @pytest.mark.parametrize("sentence_count", [6, 7, 11, 12, 23])
+    def test_sentences_distributed_across_scenes(self, sentence_count):
+        """Test that extra sentences are spread evenly and none are dropped"""
+        from app.routes.story import _split_text_into_scenes
+        
+        sentences = [f"Sentence number {i}." for i in range(1, sentence_count + 1)]
+        
+        scenes = _split_text_into_scenes(" ".join(sentences), max_scenes=5)
+        scene_sizes = [scene.count(".") for scene in scenes]
+        
+        assert len(scenes) == 5
+        assert " ".join(scenes) == " ".join(sentences)
+        assert max(scene_sizes) - min(scene_sizes) <= 1
+    
+    def test_remainder_scenes(self):
+        """Test the exact scene sizes when sentences don't divide evenly"""
+        from app.routes.story import _split_text_into_scenes
+        
+        text = " ".join(f"S{i}." for i in range(1, 13))
+        
+        scenes = _split_text_into_scenes(text, max_scenes=5)
+        
+        assert [scene.count(".") for scene in scenes] == [2, 2, 3, 2, 3]
+        assert scenes[-1] == "S10. S11. S12."
+    
+    def test_short_text_one_scene_per_sentence(self):
+        """Test that text with few sentences keeps one sentence per scene"""
+        from app.routes.story import _split_text_into_scenes
+        
+        scenes = _split_text_into_scenes("It was dark. A wolf howled! Who was there?")
+        
+        assert scenes == ["It was dark.", "A wolf howled!", "Who was there?"]
+    
+    def test_paragraphs_used_as_scenes(self):
+        """Test that a few paragraphs are used as scenes directly"""
+        from app.routes.story import _split_text_into_scenes
+        
+        scenes = _split_text_into_scenes("First part. Still first.\n\nSecond part.")
+        
+        assert scenes == ["First part. Still first.", "Second part."]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])